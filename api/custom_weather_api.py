@@ -6,6 +6,7 @@ It includes error handling, CORS support, and environment variable configuration
 
 Features:
     - Current weather data retrieval by location
+    - In-process TTL cache for repeat lookups (X-Cache: HIT/MISS header)
     - Error handling for API failures
     - CORS support for cross-origin requests
     - Environment variable configuration
@@ -20,6 +21,12 @@ Dependencies:
 Environment Variables:
     - CUSTOM_WEATHER_API_PORT: Port for the API server (default: 5000)
     - OPENWEATHER_API_KEY: API key for OpenWeatherMap
+    - FLASK_DEBUG: Set to 1 to enable the Flask debugger and reloader
+    - CORS_ORIGIN: Allowed CORS origin for /weather (default: *)
+
+Running:
+    - Development: python api/custom_weather_api.py
+    - Production: gunicorn -k gevent -w 4 --worker-connections 1000 -b 0.0.0.0:5000 api.custom_weather_api:app
 
 Example Usage:
     >>> import requests
@@ -29,40 +36,127 @@ Example Usage:
 """
 
 import os
+import threading
+import time
+from concurrent.futures import Future
+from urllib.parse import quote_plus
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
 
 load_dotenv()  # Load variables from .env
 
 app = Flask(__name__)
-CORS(app)  # Enable CORS for all domains
+# CORS only on the weather route; set CORS_ORIGIN to restrict the allowed origin
+CORS(app, resources={r"/weather": {"origins": os.environ.get("CORS_ORIGIN", "*")}})
 
 API_PORT = int(os.environ.get("CUSTOM_WEATHER_API_PORT", 5000))
 API_KEY = os.environ.get("OPENWEATHER_API_KEY")
+DEBUG = os.environ.get("FLASK_DEBUG") == "1"
+BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
+# Only `q` varies per lookup, so the constant part of the query is encoded once.
+_QUERY_PREFIX = f"{BASE_URL}?appid={quote_plus(API_KEY)}&units=metric&q=" if API_KEY else None
+
+# Shared session so repeat lookups reuse pooled keep-alive connections
+# instead of opening a new TCP connection per request.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,  # hand the final response to raise_for_status below
+    ),
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
 
-def get_weather_data(location):
+# Cache-aside layer in front of OpenWeatherMap, keyed on the normalized
+# location. Unknown locations are cached briefly so typos don't hammer upstream.
+CACHE_TTL = 600
+NEGATIVE_CACHE_TTL = 60
+CACHE_MAX_ENTRIES = 1024
+_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_CACHE_LOCK = threading.Lock()
+_INFLIGHT: Dict[str, Future] = {}
+
+def get_weather_data(location) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Returns the upstream payload (or error dict) and the upstream HTTP status, if any."""
     if not API_KEY:
-        return {"error": "OpenWeatherMap API key not found."}
+        return {"error": "OpenWeatherMap API key not found."}, None
     
-    base_url = "http://api.openweathermap.org/data/2.5/weather"
-    params = {'q': location, 'appid': API_KEY, 'units': 'metric'}
-
     try:
-        response = requests.get(base_url, params=params)
+        response = _SESSION.get(_QUERY_PREFIX + quote_plus(location), timeout=(2, 5))
         response.raise_for_status()
-        return response.json()
+        return response.json(), response.status_code
     except requests.exceptions.HTTPError as http_err:
         status = response.status_code
         if status == 404:
-            return {"error": f"Location '{location}' not found."}
+            return {"error": f"Location '{location}' not found."}, status
         if status == 401:
-            return {"error": "Invalid OpenWeatherMap API key."}
-        return {"error": f"HTTP error occurred: {http_err} - {response.text}"}
+            return {"error": "Invalid OpenWeatherMap API key."}, status
+        return {"error": f"HTTP error occurred: {http_err} - {response.text}"}, status
     except requests.exceptions.RequestException as req_err:
-        return {"error": f"Request error: {req_err}"}
+        return {"error": f"Request error: {req_err}"}, None
+
+def get_cached_weather_data(location) -> Tuple[Dict[str, Any], bool]:
+    """
+    Returns weather data for a location, serving repeat lookups from the cache.
+
+    Args:
+        location (str): City name or zip code
+
+    Returns:
+        Tuple[Dict[str, Any], bool]: The weather payload (or error dict) and
+        whether it was served from the cache.
+    """
+    key = location.strip().lower()
+    now = time.monotonic()
+    entry = _CACHE.get(key)
+    if entry and entry[0] > now:
+        return entry[1], True
+
+    # Single-flight: only one upstream call per location is in flight at a
+    # time; concurrent requests for the same key wait on the leader's result.
+    with _CACHE_LOCK:
+        future = _INFLIGHT.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _INFLIGHT[key] = Future()
+    if not is_leader:
+        return future.result(), False
+
+    # The upstream call runs outside the lock so concurrent requests for
+    # different locations don't serialize behind each other.
+    try:
+        data, status = get_weather_data(location)
+    except BaseException as exc:
+        with _CACHE_LOCK:
+            _INFLIGHT.pop(key, None)
+        future.set_exception(exc)
+        raise
+
+    if "error" not in data:
+        ttl = CACHE_TTL
+    elif status == 404:
+        ttl = NEGATIVE_CACHE_TTL
+    else:
+        ttl = None
+
+    with _CACHE_LOCK:
+        if ttl is not None:
+            if len(_CACHE) >= CACHE_MAX_ENTRIES:
+                _CACHE.pop(next(iter(_CACHE)), None)
+            _CACHE[key] = (now + ttl, data)
+        _INFLIGHT.pop(key, None)
+    future.set_result(data)
+    return data, False
 
 @app.route('/weather', methods=['GET'])
 def weather_endpoint():
@@ -70,13 +164,17 @@ def weather_endpoint():
     if not location:
         return jsonify({"error": "Location parameter is required."}), 400
 
-    data = get_weather_data(location)
+    data, hit = get_cached_weather_data(location)
     status_code = 500 if "error" in data else 200
-    return jsonify(data), status_code
+    response = jsonify(data)
+    response.headers['X-Cache'] = 'HIT' if hit else 'MISS'
+    return response, status_code
 
 if __name__ == '__main__':
     if not API_KEY:
         print("!!! ERROR: OPENWEATHER_API_KEY not set in .env file.")
     else:
         print(f"--- Starting Custom Weather API on http://localhost:{API_PORT} ---")
-        app.run(port=API_PORT, debug=True)
+        # Each request gets its own thread, so a slow upstream lookup only
+        # ties up that request; the pooled session above is shared by all.
+        app.run(port=API_PORT, debug=DEBUG, threaded=True)
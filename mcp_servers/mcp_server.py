@@ -1,6 +1,9 @@
 import asyncio
+import json
+import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, List, Optional
 
 # Ensure parent directories are in the path for imports
@@ -14,7 +17,13 @@ from mcp.shared.exceptions import McpError
 from mcp.types import TextContent, Tool, INVALID_PARAMS
 
 # Pydantic for input validation
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+# orjson is a faster serializer for large tool results; fall back to json if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import all our tool logic
 from tools import filesystem, github_handler, sentry_handler, weather_client
@@ -23,9 +32,51 @@ from tools import filesystem, github_handler, sentry_handler, weather_client
 from dotenv import load_dotenv
 load_dotenv()
 
+# Logs go to stderr: stdout carries the MCP stdio protocol stream.
+logging.basicConfig(
+    stream=sys.stderr,
+    level=os.getenv("MCP_LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+log = logging.getLogger("unified_mcp")
+
 # Initialize a single server
 server = Server("unified_tool_suite")
 
+# The tool handlers are blocking (requests/PyGithub/filesystem), so they run on
+# a dedicated, sized pool instead of asyncio's small shared default executor.
+MAX_WORKERS = int(os.getenv("MCP_MAX_WORKERS", "64"))
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="mcp-tool")
+
+async def _run_blocking(fn, *args):
+    """Runs a blocking tool handler on the tool executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, fn, *args)
+
+# Remote read-only tools: identical calls that arrive while one is already in
+# flight share its result instead of issuing a duplicate upstream request.
+# Local filesystem reads are left out: sharing saves no round trip and could
+# hand back content from before a write that landed in between.
+_COALESCED_TOOLS = frozenset({
+    "gh_list_repositories", "gh_list_repo_issues", "gh_search_repos", "gh_search_code", "gh_get_prs",
+    "sentry_get_issues", "sentry_get_issue_details", "sentry_get_error_frequency",
+    "sentry_get_error_patterns", "sentry_get_project_stats", "sentry_get_detailed_stacktrace",
+    "sentry_analyze_error_patterns", "sentry_get_top_errors",
+    "weather_get_current",
+})
+_INFLIGHT = {}
+
+async def _run_coalesced(name, fn, args):
+    """Runs a read-only tool handler, sharing one execution among identical concurrent calls."""
+    key = (name, args)
+    future = _INFLIGHT.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_run_blocking(fn, *args))
+        _INFLIGHT[key] = future
+        future.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # shield() so one caller being cancelled doesn't cancel the shared call
+    return await asyncio.shield(future)
+
 # --- Pydantic Models for ALL Tool Inputs ---
 
 # Filesystem
@@ -38,6 +89,7 @@ class FSWriteFileInput(BaseModel):
 
 class FSListDirectoryInput(BaseModel):
     dir_path: Annotated[str, Field(description="Path to the directory to list")]
+    include_stats: Annotated[bool, Field(description="Whether to include size and modification time for each entry")] = True
 
 class FSCreateDirectoryInput(BaseModel):
     dir_path: Annotated[str, Field(description="Path of the directory to create")]
@@ -69,14 +121,16 @@ class FSMoveFileInput(BaseModel):
 class GHListRepoIssuesInput(BaseModel):
     repo_full_name: Annotated[str, Field(description="Full name of the repo (e.g., 'owner/repo')")]
 
+class GHListManyRepoIssuesInput(BaseModel):
+    repo_full_names: Annotated[List[str], Field(description="Full names of the repos (e.g., ['owner/repo-a', 'owner/repo-b'])")]
+
 class GHCreateRepoInput(BaseModel):
     name: Annotated[str, Field(description="Name for the new repository")]
     description: Annotated[Optional[str], Field(description="Optional description")] = ""
     private: Annotated[Optional[bool], Field(description="Make repo private (default: False)")] = False
 
 class GHListRepositoriesInput(BaseModel):
-    """No input parameters needed for listing repositories"""
-    pass
+    limit: Annotated[int, Field(description="Maximum number of repositories to return")] = 100
 
 class GHForkRepoInput(BaseModel):
     repo_full_name: Annotated[str, Field(description="Full name of the repo to fork (e.g., 'owner/repo')")]
@@ -109,6 +163,7 @@ class GHSearchCodeInput(BaseModel):
 class GHGetPRsInput(BaseModel):
     repo_full_name: Annotated[str, Field(description="Full name of the repo (e.g., 'owner/repo')")]
     state: Annotated[str, Field(description="PR state (open, closed, all)")] = "open"
+    limit: Annotated[int, Field(description="Maximum number of pull requests to return")] = 100
 
 class GHReviewPRInput(BaseModel):
     repo_full_name: Annotated[str, Field(description="Full name of the repo (e.g., 'owner/repo')")]
@@ -150,327 +205,259 @@ class SentryGetProjectStatsInput(BaseModel):
 class SentryGetDetailedStacktraceInput(BaseModel):
     project_slug: Annotated[str, Field(description="Sentry project slug")]
     issue_id: Annotated[str, Field(description="ID of the issue to get detailed stacktrace for")]
+    verbose: Annotated[bool, Field(description="Include each frame's source context and local variables")] = False
 
 class SentryAnalyzeErrorPatternsInput(BaseModel):
     project_slug: Annotated[str, Field(description="Sentry project slug")]
     days: Annotated[int, Field(description="Number of days to analyze patterns")] = 7
 
+class SentryGetTopErrorsInput(BaseModel):
+    project_slug: Annotated[str, Field(description="Sentry project slug")]
+    limit: Annotated[int, Field(description="Number of most frequent issues to return")] = 10
+
 # Weather
 class WeatherGetCurrentInput(BaseModel):
     location: Annotated[str, Field(description="City name or zip code for weather")]
 
+# --- Tool Dispatch Table ---
+# Maps each tool name to (input model, handler, handler argument fields).
+TOOLS = {
+    # Filesystem Tools
+    "fs_read_file": (FSReadFileInput, filesystem.read_file, ("file_path",)),
+    "fs_write_file": (FSWriteFileInput, filesystem.write_file, ("file_path", "content")),
+    "fs_list_directory": (FSListDirectoryInput, filesystem.list_directory, ("dir_path", "include_stats")),
+    "fs_create_directory": (FSCreateDirectoryInput, filesystem.create_directory, ("dir_path",)),
+    "fs_delete_directory": (FSDeleteDirectoryInput, filesystem.delete_directory, ("dir_path", "recursive")),
+    "fs_search_files": (FSSearchFilesInput, filesystem.search_files, ("dir_path", "pattern", "recursive")),
+    "fs_get_metadata": (FSGetMetadataInput, filesystem.get_file_metadata, ("file_path",)),
+    "fs_delete_file": (FSDeleteFileInput, filesystem.delete_file, ("file_path",)),
+    "fs_copy_file": (FSCopyFileInput, filesystem.copy_file, ("src_path", "dst_path")),
+    "fs_move_file": (FSMoveFileInput, filesystem.move_file, ("src_path", "dst_path")),
+    # GitHub Tools
+    "gh_list_repositories": (GHListRepositoriesInput, github_handler.list_repositories, ("limit",)),
+    "gh_list_repo_issues": (GHListRepoIssuesInput, github_handler.list_repo_issues, ("repo_full_name",)),
+    "gh_list_many_repo_issues": (GHListManyRepoIssuesInput, github_handler.list_many_repo_issues, ("repo_full_names",)),
+    "gh_create_repo": (GHCreateRepoInput, github_handler.create_repo, ("name", "description", "private")),
+    "gh_fork_repo": (GHForkRepoInput, github_handler.fork_repo, ("repo_full_name",)),
+    "gh_create_issue": (GHCreateIssueInput, github_handler.create_issue, ("repo_full_name", "title", "body", "labels")),
+    "gh_create_pr": (GHCreatePRInput, github_handler.create_pull_request, ("repo_full_name", "title", "head", "base", "body")),
+    "gh_search_repos": (GHSearchReposInput, github_handler.search_repositories, ("query", "sort", "order", "limit")),
+    "gh_search_code": (GHSearchCodeInput, github_handler.search_code, ("query", "repo", "language", "limit")),
+    "gh_get_prs": (GHGetPRsInput, github_handler.get_pull_requests, ("repo_full_name", "state", "limit")),
+    "gh_review_pr": (GHReviewPRInput, github_handler.review_pull_request, ("repo_full_name", "pr_number", "body", "event")),
+    "gh_update_readme": (GHUpdateReadmeInput, github_handler.update_readme, ("repo_full_name", "content", "commit_message")),
+    # Sentry Tools
+    "sentry_get_issues": (SentryGetIssuesInput, sentry_handler.get_sentry_issues, ("project_slug", "query", "stats_period")),
+    "sentry_get_issue_details": (SentryGetIssueDetailsInput, sentry_handler.get_issue_details, ("project_slug", "issue_id")),
+    "sentry_get_error_frequency": (SentryGetErrorFrequencyInput, sentry_handler.get_error_frequency, ("project_slug", "days")),
+    "sentry_get_error_patterns": (SentryGetErrorPatternsInput, sentry_handler.get_error_patterns, ("project_slug", "days")),
+    "sentry_update_issue_status": (SentryUpdateIssueStatusInput, sentry_handler.update_issue_status, ("project_slug", "issue_id", "status")),
+    "sentry_get_project_stats": (SentryGetProjectStatsInput, sentry_handler.get_project_stats, ("project_slug",)),
+    "sentry_get_detailed_stacktrace": (SentryGetDetailedStacktraceInput, sentry_handler.get_detailed_stacktrace, ("project_slug", "issue_id", "verbose")),
+    "sentry_analyze_error_patterns": (SentryAnalyzeErrorPatternsInput, sentry_handler.analyze_error_patterns, ("project_slug", "days")),
+    "sentry_get_top_errors": (SentryGetTopErrorsInput, sentry_handler.get_top_errors, ("project_slug", "limit")),
+    # Weather Tools
+    "weather_get_current": (WeatherGetCurrentInput, weather_client.get_current_weather, ("location",)),
+}
+
+# Validators are built once per tool so each call goes straight to the
+# compiled pydantic-core validator.
+_ADAPTERS = {name: TypeAdapter(model) for name, (model, _, _) in TOOLS.items()}
+
 # --- MCP Tool Implementation ---
 
+# The catalog is static for the life of the process, so the tool list (and
+# every model_json_schema() call) is built once at import.
+_TOOL_LIST = [
+    # Filesystem Tools
+    Tool(
+        name="fs_read_file",
+        description="Reads the content of a local file.",
+        inputSchema=FSReadFileInput.model_json_schema(),
+    ),
+    Tool(
+        name="fs_write_file",
+        description="Writes content to a local file.",
+        inputSchema=FSWriteFileInput.model_json_schema(),
+    ),
+    Tool(
+        name="fs_list_directory",
+        description="Lists files and directories in a local path.",
+        inputSchema=FSListDirectoryInput.model_json_schema(),
+    ),
+    Tool(
+        name="fs_create_directory",
+        description="Creates a new directory and any necessary parent directories.",
+        inputSchema=FSCreateDirectoryInput.model_json_schema(),
+    ),
+    Tool(
+        name="fs_delete_directory",
+        description="Deletes a directory, optionally recursively.",
+        inputSchema=FSDeleteDirectoryInput.model_json_schema(),
+    ),
+    Tool(
+        name="fs_search_files",
+        description="Searches for files matching a pattern in a directory.",
+        inputSchema=FSSearchFilesInput.model_json_schema(),
+    ),
+    Tool(
+        name="fs_get_metadata",
+        description="Gets detailed metadata about a file.",
+        inputSchema=FSGetMetadataInput.model_json_schema(),
+    ),
+    Tool(
+        name="fs_delete_file",
+        description="Deletes a file.",
+        inputSchema=FSDeleteFileInput.model_json_schema(),
+    ),
+    Tool(
+        name="fs_copy_file",
+        description="Copies a file from source to destination.",
+        inputSchema=FSCopyFileInput.model_json_schema(),
+    ),
+    Tool(
+        name="fs_move_file",
+        description="Moves a file from source to destination.",
+        inputSchema=FSMoveFileInput.model_json_schema(),
+    ),
+    # GitHub Tools
+    Tool(
+        name="gh_list_repositories",
+        description="Lists all GitHub repositories accessible by the authenticated user.",
+        inputSchema=GHListRepositoriesInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_list_repo_issues",
+        description="Lists open issues for a GitHub repository.",
+        inputSchema=GHListRepoIssuesInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_list_many_repo_issues",
+        description="Lists open issues for several GitHub repositories in one call.",
+        inputSchema=GHListManyRepoIssuesInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_create_repo",
+        description="Creates a new GitHub repository.",
+        inputSchema=GHCreateRepoInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_fork_repo",
+        description="Forks an existing GitHub repository.",
+        inputSchema=GHForkRepoInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_create_issue",
+        description="Creates a new issue in a repository.",
+        inputSchema=GHCreateIssueInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_create_pr",
+        description="Creates a new pull request.",
+        inputSchema=GHCreatePRInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_search_repos",
+        description="Searches for GitHub repositories.",
+        inputSchema=GHSearchReposInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_search_code",
+        description="Searches for code in GitHub repositories.",
+        inputSchema=GHSearchCodeInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_get_prs",
+        description="Lists pull requests in a repository.",
+        inputSchema=GHGetPRsInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_review_pr",
+        description="Reviews a pull request.",
+        inputSchema=GHReviewPRInput.model_json_schema(),
+    ),
+    Tool(
+        name="gh_update_readme",
+        description="Updates or creates the README.md file in a repository.",
+        inputSchema=GHUpdateReadmeInput.model_json_schema(),
+    ),
+    # Sentry Tools
+    Tool(
+        name="sentry_get_issues",
+        description="Gets issues for a Sentry project with optional filtering.",
+        inputSchema=SentryGetIssuesInput.model_json_schema(),
+    ),
+    Tool(
+        name="sentry_get_issue_details",
+        description="Gets detailed information about a specific issue including stacktrace.",
+        inputSchema=SentryGetIssueDetailsInput.model_json_schema(),
+    ),
+    Tool(
+        name="sentry_get_error_frequency",
+        description="Gets error frequency statistics over a time period.",
+        inputSchema=SentryGetErrorFrequencyInput.model_json_schema(),
+    ),
+    Tool(
+        name="sentry_get_error_patterns",
+        description="Analyzes error patterns and groups similar errors.",
+        inputSchema=SentryGetErrorPatternsInput.model_json_schema(),
+    ),
+    Tool(
+        name="sentry_update_issue_status",
+        description="Updates the status of a Sentry issue.",
+        inputSchema=SentryUpdateIssueStatusInput.model_json_schema(),
+    ),
+    Tool(
+        name="sentry_get_project_stats",
+        description="Gets overall project statistics and health metrics.",
+        inputSchema=SentryGetProjectStatsInput.model_json_schema(),
+    ),
+    Tool(
+        name="sentry_get_detailed_stacktrace",
+        description="Gets detailed stacktrace analysis including frame-by-frame analysis, context, and error propagation path.",
+        inputSchema=SentryGetDetailedStacktraceInput.model_json_schema(),
+    ),
+    Tool(
+        name="sentry_analyze_error_patterns",
+        description="Analyzes error patterns in detail including frequency trends, user impact, and correlation patterns.",
+        inputSchema=SentryAnalyzeErrorPatternsInput.model_json_schema(),
+    ),
+    Tool(
+        name="sentry_get_top_errors",
+        description="Gets a project's most frequent issues, fetching only as many pages as needed.",
+        inputSchema=SentryGetTopErrorsInput.model_json_schema(),
+    ),
+    # Weather Tools
+    Tool(
+        name="weather_get_current",
+        description="Gets the current weather for a location.",
+        inputSchema=WeatherGetCurrentInput.model_json_schema(),
+    ),
+]
+
 @server.list_tools()
 async def list_tools() -> List[Tool]:
     """Lists ALL available tools from every integrated service."""
-    return [
-        # Filesystem Tools
-        Tool(
-            name="fs_read_file",
-            description="Reads the content of a local file.",
-            inputSchema=FSReadFileInput.model_json_schema(),
-        ),
-        Tool(
-            name="fs_write_file",
-            description="Writes content to a local file.",
-            inputSchema=FSWriteFileInput.model_json_schema(),
-        ),
-        Tool(
-            name="fs_list_directory",
-            description="Lists files and directories in a local path.",
-            inputSchema=FSListDirectoryInput.model_json_schema(),
-        ),
-        Tool(
-            name="fs_create_directory",
-            description="Creates a new directory and any necessary parent directories.",
-            inputSchema=FSCreateDirectoryInput.model_json_schema(),
-        ),
-        Tool(
-            name="fs_delete_directory",
-            description="Deletes a directory, optionally recursively.",
-            inputSchema=FSDeleteDirectoryInput.model_json_schema(),
-        ),
-        Tool(
-            name="fs_search_files",
-            description="Searches for files matching a pattern in a directory.",
-            inputSchema=FSSearchFilesInput.model_json_schema(),
-        ),
-        Tool(
-            name="fs_get_metadata",
-            description="Gets detailed metadata about a file.",
-            inputSchema=FSGetMetadataInput.model_json_schema(),
-        ),
-        Tool(
-            name="fs_delete_file",
-            description="Deletes a file.",
-            inputSchema=FSDeleteFileInput.model_json_schema(),
-        ),
-        Tool(
-            name="fs_copy_file",
-            description="Copies a file from source to destination.",
-            inputSchema=FSCopyFileInput.model_json_schema(),
-        ),
-        Tool(
-            name="fs_move_file",
-            description="Moves a file from source to destination.",
-            inputSchema=FSMoveFileInput.model_json_schema(),
-        ),
-        # GitHub Tools
-        Tool(
-            name="gh_list_repositories",
-            description="Lists all GitHub repositories accessible by the authenticated user.",
-            inputSchema=GHListRepositoriesInput.model_json_schema(),
-        ),
-        Tool(
-            name="gh_list_repo_issues",
-            description="Lists open issues for a GitHub repository.",
-            inputSchema=GHListRepoIssuesInput.model_json_schema(),
-        ),
-        Tool(
-            name="gh_create_repo",
-            description="Creates a new GitHub repository.",
-            inputSchema=GHCreateRepoInput.model_json_schema(),
-        ),
-        Tool(
-            name="gh_fork_repo",
-            description="Forks an existing GitHub repository.",
-            inputSchema=GHForkRepoInput.model_json_schema(),
-        ),
-        Tool(
-            name="gh_create_issue",
-            description="Creates a new issue in a repository.",
-            inputSchema=GHCreateIssueInput.model_json_schema(),
-        ),
-        Tool(
-            name="gh_create_pr",
-            description="Creates a new pull request.",
-            inputSchema=GHCreatePRInput.model_json_schema(),
-        ),
-        Tool(
-            name="gh_search_repos",
-            description="Searches for GitHub repositories.",
-            inputSchema=GHSearchReposInput.model_json_schema(),
-        ),
-        Tool(
-            name="gh_search_code",
-            description="Searches for code in GitHub repositories.",
-            inputSchema=GHSearchCodeInput.model_json_schema(),
-        ),
-        Tool(
-            name="gh_get_prs",
-            description="Lists pull requests in a repository.",
-            inputSchema=GHGetPRsInput.model_json_schema(),
-        ),
-        Tool(
-            name="gh_review_pr",
-            description="Reviews a pull request.",
-            inputSchema=GHReviewPRInput.model_json_schema(),
-        ),
-        Tool(
-            name="gh_update_readme",
-            description="Updates or creates the README.md file in a repository.",
-            inputSchema=GHUpdateReadmeInput.model_json_schema(),
-        ),
-        # Sentry Tools
-        Tool(
-            name="sentry_get_issues",
-            description="Gets issues for a Sentry project with optional filtering.",
-            inputSchema=SentryGetIssuesInput.model_json_schema(),
-        ),
-        Tool(
-            name="sentry_get_issue_details",
-            description="Gets detailed information about a specific issue including stacktrace.",
-            inputSchema=SentryGetIssueDetailsInput.model_json_schema(),
-        ),
-        Tool(
-            name="sentry_get_error_frequency",
-            description="Gets error frequency statistics over a time period.",
-            inputSchema=SentryGetErrorFrequencyInput.model_json_schema(),
-        ),
-        Tool(
-            name="sentry_get_error_patterns",
-            description="Analyzes error patterns and groups similar errors.",
-            inputSchema=SentryGetErrorPatternsInput.model_json_schema(),
-        ),
-        Tool(
-            name="sentry_update_issue_status",
-            description="Updates the status of a Sentry issue.",
-            inputSchema=SentryUpdateIssueStatusInput.model_json_schema(),
-        ),
-        Tool(
-            name="sentry_get_project_stats",
-            description="Gets overall project statistics and health metrics.",
-            inputSchema=SentryGetProjectStatsInput.model_json_schema(),
-        ),
-        Tool(
-            name="sentry_get_detailed_stacktrace",
-            description="Gets detailed stacktrace analysis including frame-by-frame analysis, context, and error propagation path.",
-            inputSchema=SentryGetDetailedStacktraceInput.model_json_schema(),
-        ),
-        Tool(
-            name="sentry_analyze_error_patterns",
-            description="Analyzes error patterns in detail including frequency trends, user impact, and correlation patterns.",
-            inputSchema=SentryAnalyzeErrorPatternsInput.model_json_schema(),
-        ),
-        # Weather Tools
-        Tool(
-            name="weather_get_current",
-            description="Gets the current weather for a location.",
-            inputSchema=WeatherGetCurrentInput.model_json_schema(),
-        ),
-    ]
+    return _TOOL_LIST
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict):
     """Handles incoming tool calls and routes them to the correct logic."""
-    print(f"Unified MCP: Received {name} with {arguments}") # Debug log
-
-    result_dict = {}
+    log.debug("Received %s with %s", name, arguments)
 
     try:
-        # --- Route to Filesystem Tools ---
-        if name == "fs_read_file":
-            args = FSReadFileInput(**arguments)
-            result_dict = await asyncio.to_thread(filesystem.read_file, args.file_path)
-        elif name == "fs_write_file":
-            args = FSWriteFileInput(**arguments)
-            result_dict = await asyncio.to_thread(filesystem.write_file, args.file_path, args.content)
-        elif name == "fs_list_directory":
-            args = FSListDirectoryInput(**arguments)
-            result_dict = await asyncio.to_thread(filesystem.list_directory, args.dir_path)
-        elif name == "fs_create_directory":
-            args = FSCreateDirectoryInput(**arguments)
-            result_dict = await asyncio.to_thread(filesystem.create_directory, args.dir_path)
-        elif name == "fs_delete_directory":
-            args = FSDeleteDirectoryInput(**arguments)
-            result_dict = await asyncio.to_thread(filesystem.delete_directory, args.dir_path, args.recursive)
-        elif name == "fs_search_files":
-            args = FSSearchFilesInput(**arguments)
-            result_dict = await asyncio.to_thread(filesystem.search_files, args.dir_path, args.pattern, args.recursive)
-        elif name == "fs_get_metadata":
-            args = FSGetMetadataInput(**arguments)
-            result_dict = await asyncio.to_thread(filesystem.get_file_metadata, args.file_path)
-        elif name == "fs_delete_file":
-            args = FSDeleteFileInput(**arguments)
-            result_dict = await asyncio.to_thread(filesystem.delete_file, args.file_path)
-        elif name == "fs_copy_file":
-            args = FSCopyFileInput(**arguments)
-            result_dict = await asyncio.to_thread(filesystem.copy_file, args.src_path, args.dst_path)
-        elif name == "fs_move_file":
-            args = FSMoveFileInput(**arguments)
-            result_dict = await asyncio.to_thread(filesystem.move_file, args.src_path, args.dst_path)
-
-        # --- Route to GitHub Tools ---
-        elif name == "gh_list_repositories":
-            args = GHListRepositoriesInput(**arguments)
-            result_dict = await asyncio.to_thread(github_handler.list_repositories)
-        elif name == "gh_list_repo_issues":
-            args = GHListRepoIssuesInput(**arguments)
-            result_dict = await asyncio.to_thread(github_handler.list_repo_issues, args.repo_full_name)
-        elif name == "gh_create_repo":
-            args = GHCreateRepoInput(**arguments)
-            result_dict = await asyncio.to_thread(github_handler.create_repo, args.name, args.description, args.private)
-        elif name == "gh_fork_repo":
-            args = GHForkRepoInput(**arguments)
-            result_dict = await asyncio.to_thread(github_handler.fork_repo, args.repo_full_name)
-        elif name == "gh_create_issue":
-            args = GHCreateIssueInput(**arguments)
-            result_dict = await asyncio.to_thread(github_handler.create_issue, args.repo_full_name, args.title, args.body, args.labels)
-        elif name == "gh_create_pr":
-            args = GHCreatePRInput(**arguments)
-            result_dict = await asyncio.to_thread(github_handler.create_pull_request, args.repo_full_name, args.title, args.head, args.base, args.body)
-        elif name == "gh_search_repos":
-            args = GHSearchReposInput(**arguments)
-            result_dict = await asyncio.to_thread(github_handler.search_repositories, args.query, args.sort, args.order, args.limit)
-        elif name == "gh_search_code":
-            args = GHSearchCodeInput(**arguments)
-            result_dict = await asyncio.to_thread(github_handler.search_code, args.query, args.repo, args.language, args.limit)
-        elif name == "gh_get_prs":
-            args = GHGetPRsInput(**arguments)
-            result_dict = await asyncio.to_thread(github_handler.get_pull_requests, args.repo_full_name, args.state)
-        elif name == "gh_review_pr":
-            args = GHReviewPRInput(**arguments)
-            result_dict = await asyncio.to_thread(github_handler.review_pull_request, args.repo_full_name, args.pr_number, args.body, args.event)
-        elif name == "gh_update_readme":
-            args = GHUpdateReadmeInput(**arguments)
-            result_dict = await asyncio.to_thread(
-                github_handler.update_readme,
-                args.repo_full_name,
-                args.content,
-                args.commit_message
-            )
-
-        # --- Route to Sentry Tools ---
-        elif name == "sentry_get_issues":
-            args = SentryGetIssuesInput(**arguments)
-            result_dict = await asyncio.to_thread(
-                sentry_handler.get_sentry_issues,
-                args.project_slug,
-                args.query,
-                args.stats_period
-            )
-        elif name == "sentry_get_issue_details":
-            args = SentryGetIssueDetailsInput(**arguments)
-            result_dict = await asyncio.to_thread(
-                sentry_handler.get_issue_details,
-                args.project_slug,
-                args.issue_id
-            )
-        elif name == "sentry_get_error_frequency":
-            args = SentryGetErrorFrequencyInput(**arguments)
-            result_dict = await asyncio.to_thread(
-                sentry_handler.get_error_frequency,
-                args.project_slug,
-                args.days
-            )
-        elif name == "sentry_get_error_patterns":
-            args = SentryGetErrorPatternsInput(**arguments)
-            result_dict = await asyncio.to_thread(
-                sentry_handler.get_error_patterns,
-                args.project_slug,
-                args.days
-            )
-        elif name == "sentry_update_issue_status":
-            args = SentryUpdateIssueStatusInput(**arguments)
-            result_dict = await asyncio.to_thread(
-                sentry_handler.update_issue_status,
-                args.project_slug,
-                args.issue_id,
-                args.status
-            )
-        elif name == "sentry_get_project_stats":
-            args = SentryGetProjectStatsInput(**arguments)
-            result_dict = await asyncio.to_thread(
-                sentry_handler.get_project_stats,
-                args.project_slug
-            )
-        elif name == "sentry_get_detailed_stacktrace":
-            args = SentryGetDetailedStacktraceInput(**arguments)
-            result_dict = await asyncio.to_thread(
-                sentry_handler.get_detailed_stacktrace,
-                args.project_slug,
-                args.issue_id
-            )
-        elif name == "sentry_analyze_error_patterns":
-            args = SentryAnalyzeErrorPatternsInput(**arguments)
-            result_dict = await asyncio.to_thread(
-                sentry_handler.analyze_error_patterns,
-                args.project_slug,
-                args.days
-            )
-
-        # --- Route to Weather Tools ---
-        elif name == "weather_get_current":
-            args = WeatherGetCurrentInput(**arguments)
-            # This calls our custom API client, which uses 'requests',
-            # which is blocking, so use to_thread.
-            result_dict = await asyncio.to_thread(weather_client.get_current_weather, args.location)
-
-        # --- Handle Unknown Tools ---
-        else:
+        try:
+            _, handler, fields = TOOLS[name]
+        except KeyError:
             raise McpError(INVALID_PARAMS, f"Unknown tool: {name}")
 
+        args = _ADAPTERS[name].validate_python(arguments)
+        call_args = tuple(getattr(args, field) for field in fields)
+        if name in _COALESCED_TOOLS:
+            result_dict = await _run_coalesced(name, handler, call_args)
+        else:
+            result_dict = await _run_blocking(handler, *call_args)
+
         # --- Process Results ---
         if isinstance(result_dict, dict) and "error" in result_dict:
             raise McpError(INVALID_PARAMS, result_dict["error"])
@@ -478,28 +465,37 @@ async def call_tool(name: str, arguments: dict):
         # Simple formatting: Convert dict/list to string for TextContent
         # You can make this more sophisticated for better Claude output.
         if isinstance(result_dict, (dict, list)):
-           import json
-           response_text = json.dumps(result_dict, indent=2)
+           if orjson is not None:
+               # OPT_NON_STR_KEYS: Sentry groupings can key on a null field; like
+               # json.dumps, write such keys as strings ("null") instead of failing.
+               response_text = orjson.dumps(
+                   result_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+               ).decode()
+           else:
+               response_text = json.dumps(result_dict, indent=2)
         else:
            response_text = str(result_dict)
 
         return [TextContent(type="text", text=response_text)]
 
-    except ValueError as e: # Pydantic validation error
-        print(f"Unified MCP Pydantic Error: {e}")
-        raise McpError(INVALID_PARAMS, f"Invalid parameters for {name}: {e}")
+    except ValidationError as e: # Pydantic validation error
+        summary = "; ".join(
+            f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors()
+        )
+        log.warning("Invalid parameters for %s: %s", name, summary)
+        raise McpError(INVALID_PARAMS, f"Invalid parameters for {name}: {summary}")
     except McpError as e: # Re-raise known MCP errors
-        print(f"Unified MCP Error: {e.message}")
+        log.warning("Tool %s failed: %s", name, e)
         raise e
     except Exception as e: # Catch any other unexpected errors
-        print(f"Unified MCP Unexpected Error: {type(e).__name__} - {e}")
+        log.exception("Unexpected error in %s", name)
         raise McpError(INVALID_PARAMS, f"An unexpected server error occurred: {e}")
 
 async def main():
     """Main entry point for the Unified MCP server."""
-    print("--- Starting Unified MCP Server (stdio) ---")
-    print("!!! Ensure API Keys & FS Paths are set in .env !!!")
-    print("!!! Ensure custom_weather_api.py is running !!!")
+    log.info("--- Starting Unified MCP Server (stdio) ---")
+    log.info("Ensure API Keys & FS Paths are set in .env")
+    log.info("Ensure custom_weather_api.py is running")
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
@@ -518,5 +514,5 @@ if __name__ == "__main__":
     try:
         asyncio.run(main())
     except Exception as e:
-        print(f"Unified MCP Server failed: {e}")
+        log.error("Unified MCP Server failed: %s", e)
         sys.exit(1)
\ No newline at end of file
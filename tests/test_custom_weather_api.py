@@ -0,0 +1,82 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+try:
+    from api import custom_weather_api as weather_api
+except ImportError:  # Flask, requests etc. not installed
+    weather_api = None
+
+
+@unittest.skipIf(weather_api is None, "weather API dependencies not installed")
+class CachedWeatherDataTest(unittest.TestCase):
+    def setUp(self):
+        weather_api._CACHE.clear()
+        weather_api._INFLIGHT.clear()
+
+    def _fetch(self, result=None, exc=None, delay=0.0):
+        """Fake get_weather_data counting its calls; sleeps so concurrent callers overlap."""
+        calls = []
+
+        def fetch(location):
+            calls.append(location)
+            time.sleep(delay)
+            if exc is not None:
+                raise exc
+            return result
+
+        return mock.patch.object(weather_api, "get_weather_data", fetch), calls
+
+    def _concurrently(self, n=8):
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            futures = [pool.submit(weather_api.get_cached_weather_data, "Paris") for _ in range(n)]
+        return futures
+
+    def test_concurrent_misses_share_one_fetch(self):
+        payload = {"name": "Paris"}
+        patch, calls = self._fetch(result=(payload, 200), delay=0.1)
+        with patch:
+            futures = self._concurrently()
+            self.assertEqual(len(calls), 1)
+            self.assertTrue(all(f.result()[0] == payload for f in futures))
+            self.assertEqual(weather_api.get_cached_weather_data("paris "), (payload, True))
+        self.assertEqual(weather_api._INFLIGHT, {})
+
+    def test_fetch_exception_reaches_every_caller_and_is_cleaned_up(self):
+        patch, calls = self._fetch(exc=RuntimeError("boom"), delay=0.1)
+        with patch:
+            futures = self._concurrently()
+        self.assertEqual(len(calls), 1)
+        for future in futures:
+            self.assertRaises(RuntimeError, future.result)
+        self.assertEqual(weather_api._INFLIGHT, {})
+        self.assertEqual(weather_api._CACHE, {})
+
+        # The next lookup starts a fresh fetch instead of waiting on the failed one.
+        patch, calls = self._fetch(result=({"name": "Paris"}, 200))
+        with patch:
+            self.assertEqual(weather_api.get_cached_weather_data("Paris"), ({"name": "Paris"}, False))
+        self.assertEqual(len(calls), 1)
+
+    def test_not_found_is_cached_briefly(self):
+        error = {"error": "Location 'Nowhere' not found."}
+        patch, calls = self._fetch(result=(error, 404))
+        with patch:
+            self.assertEqual(weather_api.get_cached_weather_data("Nowhere"), (error, False))
+            self.assertEqual(weather_api.get_cached_weather_data("Nowhere"), (error, True))
+        self.assertEqual(len(calls), 1)
+        expires, _ = weather_api._CACHE["nowhere"]
+        self.assertLessEqual(expires, time.monotonic() + weather_api.NEGATIVE_CACHE_TTL)
+
+    def test_other_errors_are_not_cached(self):
+        error = {"error": "HTTP error occurred"}
+        patch, calls = self._fetch(result=(error, 500))
+        with patch:
+            weather_api.get_cached_weather_data("Paris")
+            self.assertEqual(weather_api.get_cached_weather_data("Paris"), (error, False))
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
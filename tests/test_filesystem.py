@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from tools import filesystem
+from tools.filesystem import copy_file, list_directory, search_files, write_file
+
+
+class CopyFileTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, data):
+        path = os.path.join(self.dir, name)
+        with open(path, "w") as f:
+            f.write(data)
+        return path
+
+    def test_copies_content(self):
+        src = self._write("a.txt", "hello")
+        dst = os.path.join(self.dir, "b.txt")
+        self.assertEqual(copy_file(src, dst)["status"], "success")
+        with open(dst) as f:
+            self.assertEqual(f.read(), "hello")
+
+    def test_same_file_is_refused_and_left_intact(self):
+        src = self._write("a.txt", "keep me")
+        result = copy_file(src, src)
+        self.assertIn("error", result)
+        with open(src) as f:
+            self.assertEqual(f.read(), "keep me")
+
+    def test_copy_onto_hard_link_is_refused(self):
+        src = self._write("a.txt", "keep me")
+        link = os.path.join(self.dir, "link.txt")
+        os.link(src, link)
+        self.assertIn("error", copy_file(src, link))
+        with open(src) as f:
+            self.assertEqual(f.read(), "keep me")
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "needs os.mkfifo")
+    def test_fifo_source_is_rejected_without_blocking(self):
+        fifo = os.path.join(self.dir, "pipe")
+        os.mkfifo(fifo)
+        result = copy_file(fifo, os.path.join(self.dir, "out"))
+        self.assertEqual(result, {"error": f"Source is not a file: {fifo}"})
+
+
+class WriteFileTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self._tmp.name, "root")
+        os.mkdir(self.root)
+        patcher = mock.patch.object(filesystem, "_WRITE_ROOT", self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_writes_under_the_root(self):
+        for path in ("sub/a.txt", "/sub/b.txt", "sub/../c.txt"):
+            self.assertEqual(write_file(path, "x")["status"], "success")
+        self.assertEqual(sorted(os.listdir(self.root)), ["c.txt", "sub"])
+        self.assertEqual(sorted(os.listdir(os.path.join(self.root, "sub"))), ["a.txt", "b.txt"])
+
+    def test_paths_escaping_the_root_are_rejected(self):
+        for path in ("../escape.txt", "sub/../../escape.txt", "/../escape.txt", "..", "."):
+            self.assertIn("error", write_file(path, "x"), path)
+        self.assertEqual(os.listdir(self._tmp.name), ["root"])
+        self.assertIn("error", write_file("../root-sibling/x.txt", "x"))
+        self.assertFalse(os.path.exists(os.path.join(self._tmp.name, "root-sibling")))
+
+
+class DirectoryErrorTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+        self.file = os.path.join(self.dir, "a.txt")
+        with open(self.file, "w") as f:
+            f.write("x")
+        self.missing = os.path.join(self.dir, "missing")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_list_directory(self):
+        self.assertEqual(list_directory(self.dir)["total_items"], 1)
+        self.assertEqual(list_directory(self.missing),
+                         {"error": f"Directory does not exist: {self.missing}"})
+        self.assertEqual(list_directory(self.file), {"error": f"Not a directory: {self.file}"})
+
+    def test_search_files(self):
+        for pattern in ("*.txt", "a.txt", "sub/*.txt"):
+            self.assertEqual(search_files(self.missing, pattern),
+                             {"error": f"Directory does not exist: {self.missing}"})
+            self.assertEqual(search_files(self.file, pattern),
+                             {"error": f"Not a directory: {self.file}"})
+        self.assertEqual(search_files(self.dir, "*.txt")["total_matches"], 1)
+        self.assertEqual(search_files(self.dir, "b.txt")["total_matches"], 0)
+
+    @unittest.skipIf(hasattr(os, "geteuid") and os.geteuid() == 0, "root ignores directory permissions")
+    def test_unreadable_directory(self):
+        locked = os.path.join(self.dir, "locked")
+        os.mkdir(locked, 0)
+        try:
+            self.assertTrue(list_directory(locked)["error"].startswith("Permission denied"))
+            self.assertTrue(search_files(locked, "*.txt")["error"].startswith("Permission denied"))
+        finally:
+            os.chmod(locked, 0o700)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest import mock
+
+try:
+    from mcp_servers import mcp_server
+except ImportError:  # mcp, pydantic, PyGithub etc. not installed
+    mcp_server = None
+
+
+@unittest.skipIf(mcp_server is None, "MCP server dependencies not installed")
+class CallToolTest(unittest.TestCase):
+    def _call(self, result):
+        model, _, fields = mcp_server.TOOLS["weather_get_current"]
+        tools = {"weather_get_current": (model, lambda location: result, fields)}
+        with mock.patch.dict(mcp_server.TOOLS, tools):
+            content = asyncio.run(mcp_server.call_tool("weather_get_current", {"location": "x"}))
+        return json.loads(content[0].text)
+
+    def test_non_str_keys_are_written_as_strings(self):
+        self.assertEqual(self._call({None: 1, "a": {None: 2}}), {"null": 1, "a": {"null": 2}})
+
+
+@unittest.skipIf(mcp_server is None, "MCP server dependencies not installed")
+class RunCoalescedTest(unittest.TestCase):
+    def _gather(self, fn, n=5, args=("a",)):
+        async def run():
+            return await asyncio.gather(
+                *(mcp_server._run_coalesced("tool", fn, args) for _ in range(n)),
+                return_exceptions=True,
+            )
+        return asyncio.run(run())
+
+    def test_concurrent_callers_share_the_leader_result(self):
+        calls = []
+
+        def handler(arg):
+            calls.append(arg)
+            time.sleep(0.05)
+            return {"value": arg}
+
+        results = self._gather(handler)
+        self.assertEqual(calls, ["a"])
+        self.assertEqual(results, [{"value": "a"}] * 5)
+        self.assertIs(results[0], results[-1])
+        self.assertEqual(mcp_server._INFLIGHT, {})
+
+    def test_concurrent_callers_share_the_leader_exception(self):
+        calls = []
+
+        def handler(arg):
+            calls.append(arg)
+            time.sleep(0.05)
+            raise RuntimeError("boom")
+
+        results = self._gather(handler)
+        self.assertEqual(calls, ["a"])
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        self.assertEqual(mcp_server._INFLIGHT, {})
+
+    def test_different_arguments_are_not_shared(self):
+        calls = []
+
+        def handler(arg):
+            calls.append(arg)
+            return arg
+
+        async def run():
+            return await asyncio.gather(
+                mcp_server._run_coalesced("tool", handler, ("a",)),
+                mcp_server._run_coalesced("tool", handler, ("b",)),
+            )
+
+        self.assertEqual(asyncio.run(run()), ["a", "b"])
+        self.assertEqual(sorted(calls), ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,79 @@
 from pathlib import Path
+import logging
 import os
-from pathlib import Path
 import shutil
 from datetime import datetime
+import errno
 import fnmatch
-from typing import List, Dict, Any
+import mmap
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Any, Iterator, Tuple
+
+log = logging.getLogger(__name__)
+
+# Per-entry errors while scanning a directory are counted; only this many
+# are included in the debug log line for that directory.
+_MAX_LOGGED_ERRORS = 5
+
+# Root directory write_file writes under. Set WRITE_ROOT to override.
+_WRITE_ROOT = os.path.abspath(os.path.expanduser(os.environ.get("WRITE_ROOT", "~/Downloads")))
+
+# Paths used for several syscalls in one call are encoded to bytes once up
+# front, rather than by CPython on every syscall.
+_fsenc = os.fsencode
+
+# Files larger than this are read through mmap rather than os.read.
+_MMAP_THRESHOLD = 1 << 20
+
+# Directory scans for recursive search_files run on this pool; threads are
+# started lazily, on the first search that has more than one directory to scan.
+_SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("FS_SEARCH_WORKERS", min(32, (os.cpu_count() or 1) * 4))),
+    thread_name_prefix="fs-search",
+)
 
 
+def _read_text(file_path: str) -> str:
+    """
+    Read a regular file as UTF-8 text with one open, one fstat and as few
+    read calls as the file size allows. Files over _MMAP_THRESHOLD are
+    mapped and decoded in place.
+
+    Raises:
+        IsADirectoryError: If the path is not a regular file.
+    """
+    # O_NONBLOCK keeps a FIFO from blocking the open; it is a no-op for regular files.
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            raise IsADirectoryError(file_path)
+        if st.st_size > _MMAP_THRESHOLD:
+            # Decode straight out of the page cache instead of copying the
+            # file into a bytes object first.
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, "utf-8")
+        else:
+            chunks = []
+            size = max(st.st_size, 1) + 1  # one extra byte detects growth/EOF in a single call
+            while True:
+                chunk = os.read(fd, size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            text = b"".join(chunks).decode("utf-8")
+    finally:
+        os.close(fd)
+    # Match Path.read_text's universal-newline handling.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 def read_file(file_path: str) -> Dict[str, Any]:
     """
     Read the contents of a file.
@@ -27,9 +94,9 @@ def read_file(file_path: str) -> Dict[str, Any]:
         ...     print(f"Error: {result['error']}")
     """
     try:
-        p = Path(file_path).resolve()
-        if not p.is_file(): return {"error": f"Not a file: {file_path}"}
-        return {"content": p.read_text(encoding='utf-8')}
+        return {"content": _read_text(file_path)}
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return {"error": f"Not a file: {file_path}"}
     except Exception as e: return {"error": str(e)}
 
 def write_file(file_path: str, content: str) -> Dict[str, Any]:
@@ -37,12 +104,17 @@ def write_file(file_path: str, content: str) -> Dict[str, Any]:
     Write content to a file, creating parent directories if they don't exist.
     
     Args:
-        file_path (str): Path where the file should be written
+        file_path (str): Path where the file should be written, relative to
+                         the write root (WRITE_ROOT, default ~/Downloads).
+                         Paths that resolve outside it (e.g. via "..") are
+                         rejected.
         content (str): Content to write to the file
         
     Returns:
         Dict[str, Any]: A dictionary containing either:
             - {"status": "success", "message": str} if successful
+            - {"status": "unchanged", "message": str} if the file already
+              held exactly this content and nothing was written
             - {"error": str} if operation fails
             
     Example:
@@ -53,19 +125,96 @@ def write_file(file_path: str, content: str) -> Dict[str, Any]:
         ...     print(f"Error: {result['error']}")
     """
     try:
-        file_path = "/Users/yashagarwal/Downloads/"+file_path
-        p = Path(file_path).resolve()
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(content, encoding='utf-8')
+        # Relative and absolute paths alike land under the write root; ".."
+        # must not climb out of it (checked lexically, after normpath).
+        target = os.path.normpath(os.path.join(_WRITE_ROOT, file_path.lstrip("/\\")))
+        if not target.startswith(os.path.join(_WRITE_ROOT, "")):
+            return {"error": f"Path is outside the write root {_WRITE_ROOT}: {file_path}"}
+        file_path = target
+        p = _fsenc(target)
+        data = content.encode('utf-8')
+
+        # Skip the write entirely when the file already holds this content.
+        try:
+            st = os.stat(p)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(p), exist_ok=True)
+        else:
+            if stat.S_ISREG(st.st_mode) and st.st_size == len(data):
+                with open(p, 'rb') as f:
+                    if f.read() == data:
+                        return {"status": "unchanged", "message": f"Content unchanged: {file_path}"}
+
+        fd = os.open(p, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         return {"status": "success", "message": f"Wrote to {file_path}"}
     except Exception as e: return {"error": str(e)}
 
-def list_directory(dir_path: str) -> Dict[str, Any]:
+def _log_skipped(dir_path: str, skipped: int, sample: List[str]) -> None:
+    """Log one debug line summarising the entries skipped while scanning dir_path."""
+    if skipped:
+        log.debug("Skipped %d entries in %s: %s", skipped, dir_path, "; ".join(sample))
+
+def iter_list_directory(dir_path: str, include_stats: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield the entries of a directory.
+    
+    Streaming counterpart of list_directory: entries are yielded as the
+    directory is read, so large directories never need to be held in memory.
+    The directory is opened on the first iteration; errors opening it
+    (missing, not a directory, no permission) are raised as OSError.
+    
+    Args:
+        dir_path (str): Path to the directory to list
+        include_stats (bool, optional): Whether to stat each entry for size and
+                                        modification time. Defaults to True.
+        
+    Yields:
+        Dict[str, Any]: One item per entry, shaped like list_directory's items
+        
+    Example:
+        >>> for item in iter_list_directory("/path/to/dir", include_stats=False):
+        ...     print(item["name"])
+    """
+    # os.scandir hands back the entry type from the directory read, so only
+    # one stat per entry is needed.
+    skipped, sample = 0, []
+    with os.scandir(os.path.abspath(dir_path)) as it:
+        for entry in it:
+            try:
+                if not include_stats:
+                    yield {"name": entry.name, "is_dir": entry.is_dir()}
+                    continue
+                st = entry.stat()
+                item = {
+                    "name": entry.name,
+                    "is_dir": entry.is_dir(),
+                    "size": st.st_size if entry.is_file() else 0,
+                    "modified": st.st_mtime
+                }
+            except OSError as e:
+                skipped += 1
+                if len(sample) < _MAX_LOGGED_ERRORS:
+                    sample.append(f"{entry.name}: {e}")
+                continue
+            yield item
+    _log_skipped(dir_path, skipped, sample)
+
+def list_directory(dir_path: str, include_stats: bool = True) -> Dict[str, Any]:
     """
     List contents of a directory with detailed information about each item.
     
     Args:
         dir_path (str): Path to the directory to list
+        include_stats (bool, optional): Whether to stat each entry for size and
+                                        modification time. When False, items only
+                                        carry name and is_dir, both taken from the
+                                        directory read itself. Defaults to True.
         
     Returns:
         Dict[str, Any]: A dictionary containing either:
@@ -79,8 +228,8 @@ def list_directory(dir_path: str) -> Dict[str, Any]:
     Each item in the items list contains:
         - name: Item name
         - is_dir: Whether item is a directory
-        - size: File size in bytes (0 for directories)
-        - modified: Last modification timestamp
+        - size: File size in bytes (0 for directories), only if include_stats
+        - modified: Last modification timestamp, only if include_stats
         
     Example:
         >>> result = list_directory("/path/to/dir")
@@ -90,44 +239,24 @@ def list_directory(dir_path: str) -> Dict[str, Any]:
         ... else:
         ...     print(f"Error: {result['error']}")
     """
-    print(dir_path)
+    log.debug("list_directory %s", dir_path)
     try:
-        # Convert to absolute path and resolve any symlinks
-        p = Path(dir_path).resolve()
-        
-        # Check if path exists
-        if not p.exists():
-            return {"error": f"Directory does not exist: {dir_path}"}
-            
-        # Check if it's a directory
-        if not p.is_dir():
-            return {"error": f"Not a directory: {dir_path}"}
-            
-        # Check if we have permission to read the directory
-        if not os.access(p, os.R_OK):
-            return {"error": f"No permission to read directory: {dir_path}"}
-            
-        # Get directory contents with more details
-        items = []
-        for item in p.iterdir():
-            try:
-                item_info = {
-                    "name": item.name,
-                    "is_dir": item.is_dir(),
-                    "size": item.stat().st_size if item.is_file() else 0,
-                    "modified": item.stat().st_mtime
-                }
-                items.append(item_info)
-            except (PermissionError, Exception) as e:
-                print(f"Error accessing {item}: {e}")
-                continue
-                
+        # Convert to absolute path (pure string operation, symlinks are left as-is)
+        path = os.path.abspath(dir_path)
+
+        # No exists()/is_dir() pre-checks: scandir's own error says which it was.
+        items = list(iter_list_directory(path, include_stats))
+
         return {
             "items": items,
-            "path": str(p),
+            "path": path,
             "total_items": len(items)
         }
         
+    except FileNotFoundError:
+        return {"error": f"Directory does not exist: {dir_path}"}
+    except NotADirectoryError:
+        return {"error": f"Not a directory: {dir_path}"}
     except PermissionError as e:
         return {"error": f"Permission denied: {str(e)}"}
     except Exception as e:
@@ -153,11 +282,10 @@ def create_directory(dir_path: str) -> Dict[str, Any]:
         ...     print(f"Error: {result['error']}")
     """
     try:
-        p = Path(dir_path).resolve()
-        if p.exists():
-            return {"error": f"Directory already exists: {dir_path}"}
-        p.mkdir(parents=True, exist_ok=True)
+        os.makedirs(os.path.abspath(dir_path))
         return {"status": "success", "message": f"Created directory: {dir_path}"}
+    except FileExistsError:
+        return {"error": f"Directory already exists: {dir_path}"}
     except Exception as e:
         return {"error": str(e)}
 
@@ -182,20 +310,159 @@ def delete_directory(dir_path: str, recursive: bool = False) -> Dict[str, Any]:
         >>> result = delete_directory("dir_with_contents", recursive=True)
     """
     try:
-        p = Path(dir_path).resolve()
-        if not p.exists():
-            return {"error": f"Directory does not exist: {dir_path}"}
-        if not p.is_dir():
-            return {"error": f"Not a directory: {dir_path}"}
-            
+        p = os.path.abspath(dir_path)
         if recursive:
             shutil.rmtree(p)
         else:
-            p.rmdir()  # Will fail if directory is not empty
+            os.rmdir(p)  # Will fail if directory is not empty
         return {"status": "success", "message": f"Deleted directory: {dir_path}"}
+    except FileNotFoundError:
+        return {"error": f"Directory does not exist: {dir_path}"}
+    except NotADirectoryError:
+        return {"error": f"Not a directory: {dir_path}"}
     except Exception as e:
         return {"error": str(e)}
 
+def _compile_pattern(pattern: str):
+    """
+    Return a predicate that tests a file name against a glob pattern.
+
+    Common shapes skip the regex engine: "*" matches everything, "*.ext"
+    becomes an endswith check and a pattern without wildcards is compared
+    literally. Anything else is translated and compiled once.
+    """
+    if pattern == "*":
+        return lambda name: True
+    if not any(c in pattern for c in "*?["):
+        return pattern.__eq__
+    suffix = pattern[1:]
+    if pattern.startswith("*") and not any(c in suffix for c in "*?["):
+        return lambda name: name.endswith(suffix)
+    return re.compile(fnmatch.translate(pattern)).match
+
+def _scan_dir(dir_path: str, match, recursive: bool, strict: bool = False) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Scan one directory for files whose name satisfies match.
+
+    Returns the match records (stat'ed once each) and, when recursive, the
+    subdirectories to scan next. Symlinked directories are not descended
+    into, like Path.rglob. A directory that cannot be opened is skipped,
+    unless strict, in which case the OSError is raised.
+    """
+    matches, subdirs = [], []
+    skipped, sample = 0, []
+    try:
+        it = os.scandir(dir_path)
+    except OSError as e:
+        if strict:
+            raise
+        log.debug("Error accessing directory: %s", e)
+        return matches, subdirs
+    with it:
+        for entry in it:
+            try:
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif match(entry.name) and entry.is_file():
+                    st = entry.stat()
+                    matches.append({
+                        "path": entry.path,
+                        "name": entry.name,
+                        "size": st.st_size,
+                        "modified": st.st_mtime
+                    })
+            except OSError as e:
+                skipped += 1
+                if len(sample) < _MAX_LOGGED_ERRORS:
+                    sample.append(f"{entry.name}: {e}")
+    _log_skipped(dir_path, skipped, sample)
+    return matches, subdirs
+
+def _walk(dir_path: str, pattern: str, recursive: bool) -> Iterator[Dict[str, Any]]:
+    """
+    Yield match records for files under dir_path whose name matches pattern.
+
+    Recursive searches go level by level: every directory of the current level
+    is scanned on the search pool, so scandir/stat calls (which release the GIL)
+    overlap across directories. Only the current frontier is held in memory.
+    """
+    match = _compile_pattern(pattern)
+    # The root is scanned strictly so a bad dir_path reaches the caller;
+    # unreadable directories below it are skipped.
+    found, frontier = _scan_dir(dir_path, match, recursive, strict=True)
+    yield from found
+    while frontier:
+        if len(frontier) == 1:
+            results = [_scan_dir(frontier[0], match, recursive)]
+        else:
+            results = _SEARCH_EXECUTOR.map(_scan_dir, frontier, repeat(match), repeat(recursive))
+        frontier = []
+        for found, subdirs in results:
+            yield from found
+            frontier.extend(subdirs)
+
+def iter_search_files(dir_path: str, pattern: str = "*", recursive: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield files matching a pattern in a directory.
+    
+    Streaming counterpart of search_files: each match is yielded as soon as
+    its directory has been scanned, so callers that only need the first few
+    matches can stop early without walking the whole tree. Errors opening
+    dir_path itself (missing, not a directory, no permission) are raised as
+    OSError on the first iteration.
+    
+    Args:
+        dir_path (str): Directory to search in
+        pattern (str, optional): File pattern to match (e.g., "*.txt"). Defaults to "*".
+        recursive (bool, optional): Whether to search in subdirectories. Defaults to False.
+        
+    Yields:
+        Dict[str, Any]: One match per file, with path, name, size and modified
+        
+    Example:
+        >>> from itertools import islice
+        >>> first = list(islice(iter_search_files("/path/to/dir", "*.log", recursive=True), 10))
+    """
+    root = os.path.abspath(dir_path)
+    if os.sep in pattern or (os.altsep and os.altsep in pattern):
+        # Patterns spanning directories keep pathlib's glob semantics. glob
+        # ignores a bad root, so open it once to surface the error.
+        with os.scandir(root):
+            pass
+        p = Path(root)
+        for item in (p.rglob(pattern) if recursive else p.glob(pattern)):
+            if item.is_file():  # Only include files, not directories
+                try:
+                    st = item.stat()
+                    yield {
+                        "path": str(item),
+                        "name": item.name,
+                        "size": st.st_size,
+                        "modified": st.st_mtime
+                    }
+                except Exception as e:
+                    log.debug("Error accessing %s: %s", item, e)
+                    continue
+    elif not recursive and not any(c in pattern for c in "*?["):
+        # A literal name in a single directory is one stat, not a scan.
+        path = os.path.join(root, pattern)
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Only a miss pays to tell "no such file" from a bad dir_path.
+            with os.scandir(root):
+                pass
+            return
+        if stat.S_ISREG(st.st_mode):
+            yield {
+                "path": path,
+                "name": pattern,
+                "size": st.st_size,
+                "modified": st.st_mtime
+            }
+    else:
+        yield from _walk(root, pattern, recursive)
+
 def search_files(dir_path: str, pattern: str = "*", recursive: bool = False) -> Dict[str, Any]:
     """
     Search for files matching a pattern in a directory.
@@ -224,37 +491,20 @@ def search_files(dir_path: str, pattern: str = "*", recursive: bool = False) ->
         ...         print(f"- {match['path']}")
     """
     try:
-        p = Path(dir_path).resolve()
-        if not p.exists():
-            return {"error": f"Directory does not exist: {dir_path}"}
-        if not p.is_dir():
-            return {"error": f"Not a directory: {dir_path}"}
-            
-        matches = []
-        if recursive:
-            search_path = p.rglob(pattern)
-        else:
-            search_path = p.glob(pattern)
-            
-        for item in search_path:
-            if item.is_file():  # Only include files, not directories
-                try:
-                    matches.append({
-                        "path": str(item),
-                        "name": item.name,
-                        "size": item.stat().st_size,
-                        "modified": item.stat().st_mtime
-                    })
-                except Exception as e:
-                    print(f"Error accessing {item}: {e}")
-                    continue
-                    
+        path = os.path.abspath(dir_path)
+        matches = list(iter_search_files(path, pattern, recursive))
         return {
             "matches": matches,
             "total_matches": len(matches),
-            "search_path": str(p),
+            "search_path": path,
             "pattern": pattern
         }
+    except FileNotFoundError:
+        return {"error": f"Directory does not exist: {dir_path}"}
+    except NotADirectoryError:
+        return {"error": f"Not a directory: {dir_path}"}
+    except PermissionError as e:
+        return {"error": f"Permission denied: {str(e)}"}
     except Exception as e:
         return {"error": str(e)}
 
@@ -288,23 +538,29 @@ def get_file_metadata(file_path: str) -> Dict[str, Any]:
         ...     print(f"Modified: {result['modified']}")
     """
     try:
-        p = Path(file_path).resolve()
-        if not p.exists():
+        abs_path = os.path.abspath(file_path)
+        pb = _fsenc(abs_path)
+        try:
+            st = os.lstat(pb)
+            is_symlink = stat.S_ISLNK(st.st_mode)
+            if is_symlink:
+                st = os.stat(pb)  # report on the link target
+        except FileNotFoundError:
             return {"error": f"File does not exist: {file_path}"}
-        if not p.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return {"error": f"Not a file: {file_path}"}
-            
-        stat = p.stat()
+
+        name = os.path.basename(abs_path)
         return {
-            "path": str(p),
-            "name": p.name,
-            "size": stat.st_size,
-            "created": stat.st_ctime,
-            "modified": stat.st_mtime,
-            "accessed": stat.st_atime,
-            "is_symlink": p.is_symlink(),
-            "extension": p.suffix,
-            "parent": str(p.parent)
+            "path": abs_path,
+            "name": name,
+            "size": st.st_size,
+            "created": st.st_ctime,
+            "modified": st.st_mtime,
+            "accessed": st.st_atime,
+            "is_symlink": is_symlink,
+            "extension": os.path.splitext(name)[1],
+            "parent": os.path.dirname(abs_path)
         }
     except Exception as e:
         return {"error": str(e)}
@@ -329,17 +585,64 @@ def delete_file(file_path: str) -> Dict[str, Any]:
         ...     print(f"Error: {result['error']}")
     """
     try:
-        p = Path(file_path).resolve()
-        if not p.exists():
-            return {"error": f"File does not exist: {file_path}"}
-        if not p.is_file():
-            return {"error": f"Not a file: {file_path}"}
-            
-        p.unlink()
+        os.unlink(os.path.abspath(file_path))
         return {"status": "success", "message": f"Deleted file: {file_path}"}
+    except FileNotFoundError:
+        return {"error": f"File does not exist: {file_path}"}
+    except IsADirectoryError:
+        return {"error": f"Not a file: {file_path}"}
     except Exception as e:
         return {"error": str(e)}
 
+# copy_file_range errors that mean "not supported here" rather than "copy failed".
+_COPY_FALLBACK_ERRNOS = {errno.EINVAL, errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP}
+
+def _copy_fd(src_fd: int, st: os.stat_result, dst: bytes) -> None:
+    """
+    Copy an open regular file to dst in-kernel with os.copy_file_range,
+    falling back to a read/write loop where that call is unavailable.
+
+    Raises shutil.SameFileError (before anything is truncated) when dst is
+    the source file itself.
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    # Opened without O_TRUNC so a copy onto the source (same path, hard link
+    # or symlink) can be caught before it empties the file.
+    dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT, 0o666)
+    try:
+        dst_st = os.fstat(dst_fd)
+        if (dst_st.st_dev, dst_st.st_ino) == (st.st_dev, st.st_ino):
+            raise shutil.SameFileError(os.fsdecode(dst))
+        os.ftruncate(dst_fd, 0)
+        if hasattr(os, "copy_file_range"):
+            try:
+                remaining = st.st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+                return
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                os.ftruncate(dst_fd, 0)
+
+        # Size the buffer to the destination filesystem's preferred block size.
+        bufsize = max(os.fstat(dst_fd).st_blksize, 64 * 1024)
+        while True:
+            buf = os.read(src_fd, bufsize)
+            if not buf:
+                break
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(dst_fd, view):]
+    finally:
+        os.close(dst_fd)
+
 def copy_file(src_path: str, dst_path: str) -> Dict[str, Any]:
     """
     Copy a file from source to destination.
@@ -361,15 +664,30 @@ def copy_file(src_path: str, dst_path: str) -> Dict[str, Any]:
         ...     print(f"Error: {result['error']}")
     """
     try:
-        src = Path(src_path).resolve()
-        dst = Path(dst_path).resolve()
-        
-        if not src.exists():
+        src = _fsenc(os.path.abspath(src_path))
+        dst = _fsenc(os.path.abspath(dst_path))
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+
+        try:
+            # O_NONBLOCK: opening a FIFO for reading would otherwise block until
+            # a writer shows up; the S_ISREG check below then rejects it.
+            src_fd = os.open(src, os.O_RDONLY | os.O_NONBLOCK)
+        except FileNotFoundError:
             return {"error": f"Source file does not exist: {src_path}"}
-        if not src.is_file():
-            return {"error": f"Source is not a file: {src_path}"}
-            
-        shutil.copy2(src, dst)
+        try:
+            st = os.fstat(src_fd)
+            if not stat.S_ISREG(st.st_mode):
+                return {"error": f"Source is not a file: {src_path}"}
+            try:
+                _copy_fd(src_fd, st, dst)
+            except shutil.SameFileError:
+                return {"error": f"Source and destination are the same file: {src_path}"}
+        finally:
+            os.close(src_fd)
+        # Same metadata copy2 would apply: permission bits and timestamps.
+        os.chmod(dst, stat.S_IMODE(st.st_mode))
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
         return {"status": "success", "message": f"Copied {src_path} to {dst_path}"}
     except Exception as e:
         return {"error": str(e)}
@@ -395,15 +713,27 @@ def move_file(src_path: str, dst_path: str) -> Dict[str, Any]:
         ...     print(f"Error: {result['error']}")
     """
     try:
-        src = Path(src_path).resolve()
-        dst = Path(dst_path).resolve()
-        
-        if not src.exists():
+        src = os.path.abspath(src_path)
+        dst = os.path.abspath(dst_path)
+        src_b, dst_b = _fsenc(src), _fsenc(dst)
+
+        try:
+            st = os.stat(src_b)
+        except FileNotFoundError:
             return {"error": f"Source file does not exist: {src_path}"}
-        if not src.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return {"error": f"Source is not a file: {src_path}"}
-            
-        shutil.move(src, dst)
+
+        # A same-filesystem move is a single rename; shutil.move handles
+        # cross-device moves and moving into an existing directory.
+        try:
+            os.rename(src_b, dst_b)
+        except IsADirectoryError:
+            shutil.move(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dst)
         return {"status": "success", "message": f"Moved {src_path} to {dst_path}"}
     except Exception as e:
         return {"error": str(e)}
@@ -1,27 +1,362 @@
+import hashlib
 import os
-from github import Github, GithubException
-from typing import Dict, Any, List, Optional
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache, partial, wraps
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+from github import Github, GithubException, GithubRetry, UnknownObjectException
+from itertools import cycle, islice
+from urllib.parse import parse_qs, urlencode, urlparse
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 TOKEN = os.getenv("GITHUB_TOKEN")
+# GitHub rate-limits per token, so a comma-separated GITHUB_TOKENS spreads calls
+# round-robin over several tokens; a token that hits its limit is skipped
+# until its reset time.
+TOKENS = [t.strip() for t in os.getenv("GITHUB_TOKENS", TOKEN or "").split(",") if t.strip()]
+# GitHub's maximum page size; PyGithub defaults to 30, which turns a 100-item
+# listing or a limit=50 search into several round trips.
+PER_PAGE = 100
+# Connection pool size for the shared clients. With pool_size set, PyGithub
+# keeps its HTTPS connections alive between calls instead of reconnecting
+# (TCP + TLS handshake) on every request.
+POOL_SIZE = int(os.getenv("GITHUB_POOL_SIZE", "20"))
+# Cap on concurrent GitHub calls from this process; bursts above this trip
+# GitHub's secondary ("abuse") rate limit. Retries back off on secondary
+# limits (Retry-After) and 5xx; see _Retry for the primary limit.
+CONCURRENCY = int(os.getenv("GH_CONCURRENCY", "8"))
+MAX_RETRIES = 3
+_SEM = threading.BoundedSemaphore(CONCURRENCY)
+
+class _Retry(GithubRetry):
+    """GithubRetry that gives up at once on an exhausted primary rate limit.
+
+    GithubRetry would sleep until X-RateLimit-Reset (up to an hour) while the
+    caller holds a _SEM slot. Handing the 403/429 back instead lets
+    _gh_error/_http_error take the token out of rotation and the next call
+    use another one. Only idempotent methods are retried, so a POST such as
+    create_issue or a fork is never sent twice.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("allowed_methods", Retry.DEFAULT_ALLOWED_METHODS)
+        super().__init__(**kwargs)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if (response is not None and response.status in (403, 429)
+                and response.headers.get("X-RateLimit-Remaining") == "0"):
+            raise MaxRetryError(_pool, url, "primary rate limit exhausted")
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+def _retry() -> Retry:
+    # raise_on_status=False: when retries stop, the final response goes back to
+    # the caller (and its rate-limit headers to _note_rate_limit) instead of a
+    # bare RetryError.
+    return _Retry(total=MAX_RETRIES, raise_on_status=False)
+
+def _throttled(fn):
+    """Run fn while holding one of the CONCURRENCY slots."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with _SEM:
+            return fn(*args, **kwargs)
+    return wrapper
+
+_END = object()  # exhausted-iterator sentinel
+
+class GraphQLError(Exception):
+    """Error reported in the "errors" field of a GitHub GraphQL response."""
+
+_token_cycle = cycle(TOKENS)
+_TOKEN_LOCK = threading.Lock()
+_EXHAUSTED: Dict[str, float] = {}  # token -> epoch time its rate limit resets
+_local = threading.local()  # token behind the last client handed to this thread
+
+# Repository objects are cached so repeat calls against the same repo skip the
+# GET /repos/{owner}/{repo} round trip that precedes the real request.
+REPO_CACHE_TTL = 300
+REPO_CACHE_MAX_ENTRIES = 256
+_REPO_CACHE: Dict[str, Tuple[float, Any, str]] = {}
+_REPO_CACHE_LOCK = threading.Lock()
+
+def _next_token() -> str:
+    if not TOKENS: raise ValueError("GITHUB_TOKEN not set.")
+    now = time.time()
+    with _TOKEN_LOCK:
+        for _ in range(len(TOKENS)):
+            token = next(_token_cycle)
+            if _EXHAUSTED.get(token, 0) <= now:
+                break
+        else:
+            # Every token is rate limited; use the one that resets first.
+            token = min(TOKENS, key=lambda t: _EXHAUSTED[t])
+    _local.token = token
+    return token
+
+def _note_rate_limit(headers) -> None:
+    """Take the current thread's token out of rotation if headers show it is spent."""
+    token = getattr(_local, "token", None)
+    if not token or (headers or {}).get("x-ratelimit-remaining") != "0":
+        return
+    reset = float(headers.get("x-ratelimit-reset") or time.time() + 60)
+    with _TOKEN_LOCK:
+        _EXHAUSTED[token] = reset
+    # Cached repos are bound to the spent token's client; let them be refetched.
+    with _REPO_CACHE_LOCK:
+        for key in [k for k, entry in _REPO_CACHE.items() if entry[2] == token]:
+            del _REPO_CACHE[key]
+
+@lru_cache(maxsize=None)
+def _client_for(token: str):
+    return Github(token, per_page=PER_PAGE, pool_size=POOL_SIZE, retry=_retry())
 
 def _get_client():
-    if not TOKEN: raise ValueError("GITHUB_TOKEN not set.")
-    return Github(TOKEN)
+    return _client_for(_next_token())
+
+API_URL = "https://api.github.com"
+GRAPHQL_URL = f"{API_URL}/graphql"
+HTTP_TIMEOUT = (5, 30)
+# Same affiliations and ordering as REST GET /user/repos, which GraphQL does not default to.
+_LIST_REPOS_QUERY = """
+query($first: Int!, $after: String) {
+  viewer {
+    repositories(first: $first, after: $after,
+                 ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER],
+                 orderBy: {field: NAME, direction: ASC}) {
+      nodes { name nameWithOwner url description isPrivate stargazerCount forkCount }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
+@lru_cache(maxsize=None)
+def _session_for(token: str):
+    """Session for raw API calls PyGithub doesn't cover (e.g. GraphQL)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE,
+                          max_retries=_retry())
+    session.mount("https://", adapter)
+    session.headers["Authorization"] = f"bearer {token}"
+    session.headers["Accept"] = "application/vnd.github+json"
+    return session
+
+def _get_session():
+    return _session_for(_next_token())
+
+@lru_cache(maxsize=None)
+def _user_for(token: str):
+    return _client_for(token).get_user()
+
+def _get_user():
+    return _user_for(_next_token())
+
+def _get_repo(repo_full_name: str):
+    key = repo_full_name.lower()  # repo names are case-insensitive on GitHub
+    now = time.monotonic()
+    entry = _REPO_CACHE.get(key)
+    if entry and entry[0] > now:
+        _local.token = entry[2]
+        return entry[1]
+    token = _next_token()
+    repo = _client_for(token).get_repo(repo_full_name)
+    with _REPO_CACHE_LOCK:
+        if len(_REPO_CACHE) >= REPO_CACHE_MAX_ENTRIES:
+            _REPO_CACHE.pop(next(iter(_REPO_CACHE)), None)
+        _REPO_CACHE[key] = (now + REPO_CACHE_TTL, repo, token)
+    return repo
+
+def _gh_error(e: GithubException, repo_full_name: Optional[str] = None) -> Dict[str, Any]:
+    if e.status in (403, 429):
+        _note_rate_limit(e.headers)
+    # A 404/409 means the cached repo (renamed, deleted, emptied) is stale.
+    if repo_full_name and e.status in (404, 409):
+        with _REPO_CACHE_LOCK:
+            _REPO_CACHE.pop(repo_full_name.lower(), None)
+    return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+
+def _http_error(e: requests.exceptions.RequestException, repo_full_name: Optional[str] = None) -> Dict[str, Any]:
+    """_gh_error's counterpart for calls made through the raw session."""
+    response = e.response
+    if response is None:
+        return {"error": f"GH Error: {e}"}
+    if response.status_code in (403, 429):
+        _note_rate_limit({k.lower(): v for k, v in response.headers.items()})
+    if repo_full_name and response.status_code in (404, 409):
+        with _REPO_CACHE_LOCK:
+            _REPO_CACHE.pop(repo_full_name.lower(), None)
+    try:
+        message = response.json().get("message", str(e))
+    except ValueError:
+        message = str(e)
+    return {"error": f"GH Error: {message}"}
+
+# Conditional-GET cache for REST listings: (token, url) -> (etag, body, next page url, last page).
+# Replaying the ETag as If-None-Match turns an unchanged page into a small 304,
+# which GitHub does not count against the rate limit.
+ETAG_CACHE_MAX_ENTRIES = 512
+_ETAG_CACHE: Dict[Tuple[str, str], Tuple[str, Any, Optional[str], int]] = {}
+_ETAG_CACHE_LOCK = threading.Lock()
+
+# Pages 2..N of a listing are fetched concurrently once page 1's Link header
+# says how many there are, so a long listing costs about one round trip per
+# PAGE_WORKERS pages instead of one per page. Listing handlers are not
+# @_throttled as a whole; each page request takes its own CONCURRENCY slot
+# (_get_page, _get_results_page), so the fan-out stays inside the cap.
+PAGE_WORKERS = int(os.getenv("GITHUB_PAGE_WORKERS", "4"))
+_PAGE_EXECUTOR = ThreadPoolExecutor(max_workers=PAGE_WORKERS, thread_name_prefix="gh-page")
+
+def _iso(ts: Optional[str]) -> Optional[str]:
+    """Rewrite a REST "...Z" timestamp as datetime.isoformat() would ("...+00:00")."""
+    return ts[:-1] + "+00:00" if ts and ts.endswith("Z") else ts
+
+def _page_number(url: Optional[str]) -> int:
+    """Return the page= query parameter of a Link URL (1 when absent)."""
+    if not url:
+        return 1
+    return int(parse_qs(urlparse(url).query).get("page", ["1"])[0])
+
+@_throttled
+def _get_page(token: str, url: str) -> Tuple[Any, Optional[str], int]:
+    """GET one page of a REST listing, revalidating with its ETag; returns (body, next url, last page)."""
+    key = (token, url)
+    cached = _ETAG_CACHE.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else None
+    response = _session_for(token).get(url, headers=headers, timeout=HTTP_TIMEOUT)
+    if response.status_code == 304 and cached:
+        return cached[1], cached[2], cached[3]
+    response.raise_for_status()
+    body = response.json()
+    next_url = response.links.get("next", {}).get("url")
+    last_page = _page_number(response.links.get("last", {}).get("url"))
+    etag = response.headers.get("ETag")
+    if etag:
+        with _ETAG_CACHE_LOCK:
+            if key not in _ETAG_CACHE and len(_ETAG_CACHE) >= ETAG_CACHE_MAX_ENTRIES:
+                _ETAG_CACHE.pop(next(iter(_ETAG_CACHE)), None)
+            _ETAG_CACHE[key] = (etag, body, next_url, last_page)
+    return body, next_url, last_page
+
+def _iter_rest(path: str, limit: Optional[int] = None, **params) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the items of a paginated REST listing, one conditional GET per page.
+
+    Page 1 is fetched first; its Link rel="last" gives the page count, and the
+    remaining pages (only as many as `limit` needs) are fetched concurrently
+    and yielded in order.
+    """
+    token = _next_token()
+    url = f"{API_URL}{path}?{urlencode(dict(params, per_page=PER_PAGE))}"
+    items, next_url, last_page = _get_page(token, url)
+    yield from items
+    if not next_url:
+        return
+    if limit is not None:
+        last_page = min(last_page, -(-limit // PER_PAGE))
+    urls = [f"{url}&page={page}" for page in range(2, last_page + 1)]
+    for items, _, _ in _PAGE_EXECUTOR.map(lambda u: _get_page(token, u), urls):
+        yield from items
+
+# Listing helpers below read each item's JSON directly (the raw session's
+# body, or _rawData for PyGithub objects) instead of going through PyGithub's
+# per-attribute properties. (The public raw_data property would trigger a
+# lazy-completion GET per item on listed objects.)
 
 def list_repo_issues(repo_full_name):
     try:
-        g = _get_client()
-        repo = g.get_repo(repo_full_name)
-        issues = repo.get_issues(state='open')
-        return {"issues": [{"number": i.number, "title": i.title, "url": i.html_url} for i in issues]}
-    except GithubException as e: return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+        issues = _iter_rest(f"/repos/{repo_full_name}/issues", state="open")
+        return {"issues": [{"number": rd["number"], "title": rd["title"], "url": rd["html_url"]} for rd in issues]}
+    except requests.exceptions.RequestException as e: return _http_error(e, repo_full_name)
     except Exception as e: return {"error": str(e)}
 
-def list_repositories() -> Dict[str, Any]:
+def list_many_repo_issues(repo_full_names: List[str], max_workers: int = 16) -> Dict[str, Any]:
     """
-    List all repositories accessible by the authenticated user.
+    List open issues for several repositories concurrently.
     
+    Args:
+        repo_full_names (List[str]): Full names of the repositories (owner/repo)
+        max_workers (int, optional): Maximum number of concurrent requests. Kept
+                                     modest to stay clear of GitHub's secondary
+                                     rate limits. Defaults to 16.
+        
+    Returns:
+        Dict[str, Any]: {"results": {repo_full_name: result}} where each result
+        has the same shape as list_repo_issues' return value
+            
+    Example:
+        >>> result = list_many_repo_issues(["owner/repo-a", "owner/repo-b"])
+        >>> for repo, r in result["results"].items():
+        ...     print(repo, len(r.get("issues", [])))
+    """
+    if not repo_full_names:
+        return {"results": {}}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(repo_full_names))) as executor:
+        return {"results": dict(zip(repo_full_names, executor.map(list_repo_issues, repo_full_names)))}
+
+def iter_repositories(limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield repositories accessible by the authenticated user.
+    
+    Pages are fetched from the GraphQL API only as the caller consumes them,
+    so stopping early never requests the rest of the listing.
+    
+    Args:
+        limit (Optional[int], optional): Stop after this many repositories; also
+                                         used to size the last page. Defaults to None.
+        
+    Yields:
+        Dict[str, Any]: Repository details, shaped like list_repositories' items
+        
+    Raises:
+        GraphQLError: If the GraphQL API reports an error
+        requests.exceptions.RequestException: On HTTP failures
+    """
+    yielded = 0
+    after = None
+    session = _get_session()  # one token for the whole walk: cursors belong to its viewer
+    # One GraphQL POST per 100 repos, asking only for the fields we return.
+    while limit is None or yielded < limit:
+        first = PER_PAGE if limit is None else min(PER_PAGE, limit - yielded)
+        response = session.post(GRAPHQL_URL, json={
+            "query": _LIST_REPOS_QUERY,
+            "variables": {"first": first, "after": after},
+        }, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            raise GraphQLError(payload["errors"][0].get("message"))
+        connection = payload["data"]["viewer"]["repositories"]
+        for node in connection["nodes"]:
+            yield {
+                "name": node["name"],
+                "full_name": node["nameWithOwner"],
+                "url": node["url"],
+                "description": node["description"],
+                "private": node["isPrivate"],
+                "stars": node["stargazerCount"],
+                "forks": node["forkCount"]
+            }
+            yielded += 1
+        if not connection["pageInfo"]["hasNextPage"]:
+            break
+        after = connection["pageInfo"]["endCursor"]
+
+@_throttled
+def list_repositories(limit: int = 100) -> Dict[str, Any]:
+    """
+    List repositories accessible by the authenticated user.
+    
+    Args:
+        limit (int, optional): Maximum number of repositories to return.
+                               Fetched through the GraphQL API, 100 per
+                               request. Defaults to 100.
+        
     Returns:
         Dict[str, Any]: A dictionary containing either:
             - {
@@ -47,26 +382,18 @@ def list_repositories() -> Dict[str, Any]:
         ...     print(f"Error: {result['error']}")
     """
     try:
-        g = _get_client()
-        user = g.get_user()
-        repos = user.get_repos()
-        return {
-            "repositories": [{
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "url": repo.html_url,
-                "description": repo.description,
-                "private": repo.private,
-                "stars": repo.stargazers_count,
-                "forks": repo.forks_count
-            } for repo in repos]
-        }
-    except GithubException as e:
-        return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+        return {"repositories": list(iter_repositories(limit))}
+    except GraphQLError as e:
+        return {"error": f"GH Error: {e}"}
+    except requests.exceptions.RequestException as e:
+        return _http_error(e)
     except Exception as e:
         return {"error": str(e)}
 
-def create_repo(name: str, description: str = "", private: bool = False) -> Dict[str, Any]:
+@_throttled
+def create_repo(name: str, description: str = "", private: bool = False,
+                has_issues: Optional[bool] = None, has_wiki: Optional[bool] = None,
+                has_downloads: Optional[bool] = None) -> Dict[str, Any]:
     """
     Create a new GitHub repository.
     
@@ -74,6 +401,12 @@ def create_repo(name: str, description: str = "", private: bool = False) -> Dict
         name (str): Name of the repository
         description (str, optional): Repository description. Defaults to "".
         private (bool, optional): Whether repository should be private. Defaults to False.
+        has_issues (Optional[bool], optional): Enable issues. None keeps GitHub's
+                                               default (enabled). Defaults to None.
+        has_wiki (Optional[bool], optional): Enable the wiki. None keeps GitHub's
+                                             default (enabled). Defaults to None.
+        has_downloads (Optional[bool], optional): Enable downloads. None keeps
+                                                  GitHub's default (enabled). Defaults to None.
         
     Returns:
         Dict[str, Any]: A dictionary containing either:
@@ -89,7 +422,7 @@ def create_repo(name: str, description: str = "", private: bool = False) -> Dict
         - url: Repository URL
         - description: Repository description
         - private: Privacy status
-        - created_at: Creation timestamp
+        - created_at: Creation timestamp (ISO 8601 string)
         
     Example:
         >>> result = create_repo("my-project", "My awesome project", private=True)
@@ -100,16 +433,15 @@ def create_repo(name: str, description: str = "", private: bool = False) -> Dict
         ...     print(f"Error: {result['error']}")
     """
     try:
-        g = _get_client()
-        user = g.get_user()
+        user = _get_user()
+        # Feature flags are only sent when they differ from GitHub's defaults.
+        flags = {"has_issues": has_issues, "has_wiki": has_wiki, "has_downloads": has_downloads}
         repo = user.create_repo(
             name=name,
             description=description,
             private=private,
-            has_issues=True,
-            has_wiki=True,
-            has_downloads=True,
-            auto_init=True  # Initialize with README
+            auto_init=True,  # Initialize with README
+            **{k: v for k, v in flags.items() if v is not None}
         )
         return {
             "status": "success",
@@ -123,10 +455,11 @@ def create_repo(name: str, description: str = "", private: bool = False) -> Dict
             }
         }
     except GithubException as e:
-        return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+        return _gh_error(e)
     except Exception as e:
         return {"error": str(e)}
 
+@_throttled
 def fork_repo(repo_full_name: str) -> Dict[str, Any]:
     """
     Fork an existing repository.
@@ -157,24 +490,26 @@ def fork_repo(repo_full_name: str) -> Dict[str, Any]:
         ...     print(f"Error: {result['error']}")
     """
     try:
-        g = _get_client()
-        user = g.get_user()
-        repo = g.get_repo(repo_full_name)
-        forked_repo = user.create_fork(repo)
+        # POST the fork directly: the endpoint only needs owner/repo, so there is
+        # no need to GET the repository first, and the response names the parent.
+        response = _get_session().post(f"{API_URL}/repos/{repo_full_name}/forks", timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        forked_repo = response.json()
         return {
             "status": "success",
             "forked_repo": {
-                "name": forked_repo.name,
-                "full_name": forked_repo.full_name,
-                "url": forked_repo.html_url,
-                "parent": repo.full_name
+                "name": forked_repo["name"],
+                "full_name": forked_repo["full_name"],
+                "url": forked_repo["html_url"],
+                "parent": forked_repo["parent"]["full_name"]
             }
         }
-    except GithubException as e:
-        return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+    except requests.exceptions.RequestException as e:
+        return _http_error(e, repo_full_name)
     except Exception as e:
         return {"error": str(e)}
 
+@_throttled
 def create_issue(repo_full_name: str, title: str, body: str = "", labels: List[str] = None) -> Dict[str, Any]:
     """
     Create a new issue in a repository.
@@ -198,7 +533,7 @@ def create_issue(repo_full_name: str, title: str, body: str = "", labels: List[s
         - title: Issue title
         - url: Issue URL
         - state: Issue state
-        - created_at: Creation timestamp
+        - created_at: Creation timestamp (ISO 8601 string)
         
     Example:
         >>> result = create_issue("owner/repo", "Bug fix", "Fix login issue", ["bug"])
@@ -209,8 +544,7 @@ def create_issue(repo_full_name: str, title: str, body: str = "", labels: List[s
         ...     print(f"Error: {result['error']}")
     """
     try:
-        g = _get_client()
-        repo = g.get_repo(repo_full_name)
+        repo = _get_repo(repo_full_name)
         issue = repo.create_issue(
             title=title,
             body=body,
@@ -227,10 +561,11 @@ def create_issue(repo_full_name: str, title: str, body: str = "", labels: List[s
             }
         }
     except GithubException as e:
-        return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+        return _gh_error(e, repo_full_name)
     except Exception as e:
         return {"error": str(e)}
 
+@_throttled
 def create_pull_request(repo_full_name: str, title: str, head: str, base: str = "main", body: str = "") -> Dict[str, Any]:
     """
     Create a pull request.
@@ -255,7 +590,7 @@ def create_pull_request(repo_full_name: str, title: str, head: str, base: str =
         - title: PR title
         - url: PR URL
         - state: PR state
-        - created_at: Creation timestamp
+        - created_at: Creation timestamp (ISO 8601 string)
         
     Example:
         >>> result = create_pull_request("owner/repo", "Add feature", "feature-branch")
@@ -266,8 +601,7 @@ def create_pull_request(repo_full_name: str, title: str, head: str, base: str =
         ...     print(f"Error: {result['error']}")
     """
     try:
-        g = _get_client()
-        repo = g.get_repo(repo_full_name)
+        repo = _get_repo(repo_full_name)
         pr = repo.create_pull(
             title=title,
             body=body,
@@ -285,10 +619,72 @@ def create_pull_request(repo_full_name: str, title: str, head: str, base: str =
             }
         }
     except GithubException as e:
-        return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+        return _gh_error(e, repo_full_name)
     except Exception as e:
         return {"error": str(e)}
 
+@_throttled
+def _get_results_page(results, page: int) -> List[Any]:
+    """Fetch one page of a PyGithub PaginatedList."""
+    return results.get_page(page)
+
+def _iter_pages(results, limit: Optional[int] = None) -> Iterator[Any]:
+    """
+    Iterate a PyGithub PaginatedList, fetching the pages `limit` needs concurrently.
+
+    Without a limit this is plain lazy iteration, holding a CONCURRENCY slot
+    for each step (the step that runs off a page fetches the next one).
+    Otherwise page 1 is fetched first and, if it is full and more are needed,
+    the rest of the needed pages are requested together.
+    """
+    if limit is None:
+        it = iter(results)
+        while True:
+            with _SEM:
+                item = next(it, _END)
+            if item is _END:
+                return
+            yield item
+    first = _get_results_page(results, 0)
+    yield from first
+    if limit <= PER_PAGE or len(first) < PER_PAGE:
+        return
+    for page in _PAGE_EXECUTOR.map(partial(_get_results_page, results), range(1, -(-limit // PER_PAGE))):
+        yield from page
+        if len(page) < PER_PAGE:
+            return
+
+def iter_search_repositories(query: str, sort: str = "stars", order: str = "desc", limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield repository search results; result pages are fetched on demand.
+    
+    Args:
+        query (str): Search query
+        sort (str, optional): Sort criteria (stars, forks, updated). Defaults to "stars".
+        order (str, optional): Sort order (asc, desc). Defaults to "desc".
+        limit (Optional[int], optional): Number of results the caller will consume;
+            when set, the pages it spans are fetched concurrently. Defaults to None.
+        
+    Yields:
+        Dict[str, Any]: Repository details, shaped like search_repositories' items
+    """
+    repos = _get_client().search_repositories(
+        query=query,
+        sort=sort,
+        order=order
+    )
+    for repo in _iter_pages(repos, limit):
+        rd = repo._rawData
+        yield {
+            "name": rd["name"],
+            "full_name": rd["full_name"],
+            "url": rd["html_url"],
+            "description": rd["description"],
+            "stars": rd["stargazers_count"],
+            "forks": rd["forks_count"],
+            "language": rd.get("language")
+        }
+
 def search_repositories(query: str, sort: str = "stars", order: str = "desc", limit: int = 10) -> Dict[str, Any]:
     """
     Search for repositories.
@@ -324,28 +720,42 @@ def search_repositories(query: str, sort: str = "stars", order: str = "desc", li
         ...     print(f"Error: {result['error']}")
     """
     try:
-        g = _get_client()
-        repos = g.search_repositories(
-            query=query,
-            sort=sort,
-            order=order
-        )
-        return {
-            "repositories": [{
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "url": repo.html_url,
-                "description": repo.description,
-                "stars": repo.stargazers_count,
-                "forks": repo.forks_count,
-                "language": repo.language
-            } for repo in repos[:limit]]
-        }
+        return {"repositories": list(islice(iter_search_repositories(query, sort, order, limit), limit))}
     except GithubException as e:
-        return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+        return _gh_error(e)
     except Exception as e:
         return {"error": str(e)}
 
+def iter_search_code(query: str, repo: Optional[str] = None, language: Optional[str] = None, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield code search results; result pages are fetched on demand.
+    
+    Args:
+        query (str): Search query
+        repo (Optional[str], optional): Repository to search in. Defaults to None.
+        language (Optional[str], optional): Language to filter by. Defaults to None.
+        limit (Optional[int], optional): Number of results the caller will consume;
+            when set, the pages it spans are fetched concurrently. Defaults to None.
+        
+    Yields:
+        Dict[str, Any]: Search result details, shaped like search_code's items
+    """
+    search_query = query
+    if repo:
+        search_query += f" repo:{repo}"
+    if language:
+        search_query += f" language:{language}"
+
+    for result in _iter_pages(_get_client().search_code(search_query), limit):
+        rd = result._rawData
+        yield {
+            "name": rd["name"],
+            "path": rd["path"],
+            "url": rd["html_url"],
+            "repository": rd["repository"]["full_name"],
+            "language": rd.get("language")  # not part of code search results; usually None
+        }
+
 def search_code(query: str, repo: Optional[str] = None, language: Optional[str] = None, limit: int = 10) -> Dict[str, Any]:
     """
     Search for code in repositories.
@@ -379,35 +789,45 @@ def search_code(query: str, repo: Optional[str] = None, language: Optional[str]
         ...     print(f"Error: {result['error']}")
     """
     try:
-        g = _get_client()
-        search_query = query
-        if repo:
-            search_query += f" repo:{repo}"
-        if language:
-            search_query += f" language:{language}"
-            
-        results = g.search_code(search_query)
-        return {
-            "results": [{
-                "name": result.name,
-                "path": result.path,
-                "url": result.html_url,
-                "repository": result.repository.full_name,
-                "language": result.language
-            } for result in results[:limit]]
-        }
+        return {"results": list(islice(iter_search_code(query, repo, language, limit), limit))}
     except GithubException as e:
-        return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+        return _gh_error(e)
     except Exception as e:
         return {"error": str(e)}
 
-def get_pull_requests(repo_full_name: str, state: str = "open") -> Dict[str, Any]:
+def iter_pull_requests(repo_full_name: str, state: str = "open", limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield pull requests in a repository; pages are fetched on demand.
+    
+    Args:
+        repo_full_name (str): Full name of the repository (owner/repo)
+        state (str, optional): PR state (open, closed, all). Defaults to "open".
+        limit (Optional[int], optional): Number of PRs the caller will consume;
+            pages beyond it are not requested. Defaults to None.
+        
+    Yields:
+        Dict[str, Any]: PR details, shaped like get_pull_requests' items
+    """
+    for rd in _iter_rest(f"/repos/{repo_full_name}/pulls", limit, state=state):
+        yield {
+            "number": rd["number"],
+            "title": rd["title"],
+            "url": rd["html_url"],
+            "state": rd["state"],
+            "created_at": _iso(rd["created_at"]),
+            "user": rd["user"]["login"],
+            "head": rd["head"]["ref"],
+            "base": rd["base"]["ref"]
+        }
+
+def get_pull_requests(repo_full_name: str, state: str = "open", limit: int = 100) -> Dict[str, Any]:
     """
     List pull requests in a repository.
     
     Args:
         repo_full_name (str): Full name of the repository (owner/repo)
         state (str, optional): PR state (open, closed, all). Defaults to "open".
+        limit (int, optional): Maximum number of pull requests to return. Defaults to 100.
         
     Returns:
         Dict[str, Any]: A dictionary containing either:
@@ -421,7 +841,7 @@ def get_pull_requests(repo_full_name: str, state: str = "open") -> Dict[str, Any
         - title: PR title
         - url: PR URL
         - state: PR state
-        - created_at: Creation timestamp
+        - created_at: Creation timestamp (ISO 8601 string)
         - user: Author username
         - head: Source branch
         - base: Target branch
@@ -435,26 +855,13 @@ def get_pull_requests(repo_full_name: str, state: str = "open") -> Dict[str, Any
         ...     print(f"Error: {result['error']}")
     """
     try:
-        g = _get_client()
-        repo = g.get_repo(repo_full_name)
-        prs = repo.get_pulls(state=state)
-        return {
-            "pull_requests": [{
-                "number": pr.number,
-                "title": pr.title,
-                "url": pr.html_url,
-                "state": pr.state,
-                "created_at": pr.created_at.isoformat(),
-                "user": pr.user.login,
-                "head": pr.head.ref,
-                "base": pr.base.ref
-            } for pr in prs]
-        }
-    except GithubException as e:
-        return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+        return {"pull_requests": list(islice(iter_pull_requests(repo_full_name, state, limit), limit))}
+    except requests.exceptions.RequestException as e:
+        return _http_error(e, repo_full_name)
     except Exception as e:
         return {"error": str(e)}
 
+@_throttled
 def review_pull_request(repo_full_name: str, pr_number: int, body: str, event: str = "APPROVE") -> Dict[str, Any]:
     """
     Review a pull request.
@@ -478,7 +885,7 @@ def review_pull_request(repo_full_name: str, pr_number: int, body: str, event: s
         - id: Review ID
         - state: Review state
         - body: Review comment
-        - submitted_at: Submission timestamp
+        - submitted_at: Submission timestamp (ISO 8601 string)
         
     Example:
         >>> result = review_pull_request("owner/repo", 123, "LGTM!", "APPROVE")
@@ -489,8 +896,7 @@ def review_pull_request(repo_full_name: str, pr_number: int, body: str, event: s
         ...     print(f"Error: {result['error']}")
     """
     try:
-        g = _get_client()
-        repo = g.get_repo(repo_full_name)
+        repo = _get_repo(repo_full_name)
         pr = repo.get_pull(pr_number)
         review = pr.create_review(
             body=body,
@@ -506,10 +912,15 @@ def review_pull_request(repo_full_name: str, pr_number: int, body: str, event: s
             }
         }
     except GithubException as e:
-        return {"error": f"GH Error: {e.data.get('message', str(e))}"}
+        return _gh_error(e, repo_full_name)
     except Exception as e:
         return {"error": str(e)}
 
+def _git_blob_sha(data: bytes) -> str:
+    """SHA-1 git assigns to a blob with these bytes (what the contents API reports as sha)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+@_throttled
 def update_readme(repo_full_name: str, content: str, commit_message: str = "Update README.md") -> Dict[str, Any]:
     """
     Update the README.md file in a repository.
@@ -522,7 +933,7 @@ def update_readme(repo_full_name: str, content: str, commit_message: str = "Upda
     Returns:
         Dict[str, Any]: A dictionary containing either:
             - {
-                "status": "success",
+                "status": str,  # "success", or "unchanged" if README already matched
                 "message": str,  # Success message
                 "repository": str,  # Repository name
                 "commit_message": str  # Commit message used
@@ -542,27 +953,38 @@ def update_readme(repo_full_name: str, content: str, commit_message: str = "Upda
         owner, repo = repo_full_name.split('/')
         
         # Get the repository
-        repository = _get_client().get_repo(repo_full_name)
+        repository = _get_repo(repo_full_name)
         
+        data = content.encode("utf-8")  # encoded once; PyGithub base64s bytes as-is
         try:
             # Try to get the existing README
             contents = repository.get_contents("README.md")
+        except UnknownObjectException:
+            # Create new README if it doesn't exist
+            repository.create_file(
+                path="README.md",
+                message=commit_message,
+                content=data
+            )
+            action = "created"
+        else:
+            # contents.sha is the git blob SHA of the current README; if the new
+            # content hashes the same, there is nothing to commit.
+            if _git_blob_sha(data) == contents.sha:
+                return {
+                    "status": "unchanged",
+                    "message": "README.md already up to date",
+                    "repository": repo_full_name,
+                    "commit_message": commit_message
+                }
             # Update existing README
             repository.update_file(
                 path="README.md",
                 message=commit_message,
-                content=content,
+                content=data,
                 sha=contents.sha
             )
             action = "updated"
-        except GithubException.UnknownObjectException:
-            # Create new README if it doesn't exist
-            repository.create_file(
-                path="README.md",
-                message=commit_message,
-                content=content
-            )
-            action = "created"
             
         return {
             "status": "success",
@@ -571,7 +993,103 @@ def update_readme(repo_full_name: str, content: str, commit_message: str = "Upda
             "commit_message": commit_message
         }
         
+    except GithubException as e:
+        return _gh_error(e, repo_full_name)
     except Exception as e:
         return {"error": f"Failed to update README: {str(e)}"}
 
-print(list_repositories())
\ No newline at end of file
+# --- Background write queue ---
+# Bulk automation (e.g. filing dozens of issues) can queue writes and carry on
+# instead of blocking on a GitHub round trip per call. Writes run on a small
+# pool so they stay well under GitHub's secondary (abuse) rate limits.
+WRITE_WORKERS = int(os.getenv("GITHUB_WRITE_WORKERS", "4"))
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=WRITE_WORKERS, thread_name_prefix="gh-write")
+# Finished results are kept until polled, but a caller that never polls must
+# not grow the map forever: the oldest are dropped after TASK_RESULT_TTL
+# seconds or once more than TASK_MAX_FINISHED are waiting.
+TASK_RESULT_TTL = 3600
+TASK_MAX_FINISHED = 1000
+_TASKS: Dict[str, Future] = {}
+_FINISHED: Dict[str, float] = {}  # task_id -> monotonic finish time, oldest first
+_TASKS_LOCK = threading.Lock()
+
+def _task_finished(task_id: str, _future: Future) -> None:
+    now = time.monotonic()
+    with _TASKS_LOCK:
+        if task_id not in _TASKS:
+            return  # already collected by task_status/wait_all
+        _FINISHED[task_id] = now
+        while _FINISHED:
+            oldest, finished_at = next(iter(_FINISHED.items()))
+            if finished_at > now - TASK_RESULT_TTL and len(_FINISHED) <= TASK_MAX_FINISHED:
+                break
+            del _FINISHED[oldest]
+            _TASKS.pop(oldest, None)
+
+def _queue(fn, *args, **kwargs) -> Dict[str, Any]:
+    task_id = uuid.uuid4().hex
+    future = _WRITE_EXECUTOR.submit(fn, *args, **kwargs)
+    with _TASKS_LOCK:
+        _TASKS[task_id] = future
+    future.add_done_callback(lambda f: _task_finished(task_id, f))
+    return {"status": "queued", "task_id": task_id}
+
+def queue_create_issue(repo_full_name: str, title: str, body: str = "", labels: List[str] = None) -> Dict[str, Any]:
+    """Queue create_issue to run in the background; see task_status and wait_all."""
+    return _queue(create_issue, repo_full_name, title, body, labels)
+
+def queue_review_pull_request(repo_full_name: str, pr_number: int, body: str, event: str = "APPROVE") -> Dict[str, Any]:
+    """Queue review_pull_request to run in the background; see task_status and wait_all."""
+    return _queue(review_pull_request, repo_full_name, pr_number, body, event)
+
+def queue_update_readme(repo_full_name: str, content: str, commit_message: str = "Update README.md") -> Dict[str, Any]:
+    """Queue update_readme to run in the background; see task_status and wait_all."""
+    return _queue(update_readme, repo_full_name, content, commit_message)
+
+def task_status(task_id: str) -> Dict[str, Any]:
+    """
+    Check on a queued write.
+    
+    Args:
+        task_id (str): ID returned by one of the queue_* functions
+        
+    Returns:
+        Dict[str, Any]: {"status": "pending"}, {"status": "done", "result": Dict}
+        once finished (the result is forgotten after this), or {"error": str}
+        for an unknown task ID or one whose result expired unpolled
+    """
+    with _TASKS_LOCK:
+        future = _TASKS.get(task_id)
+        if future is None:
+            return {"error": f"Unknown task: {task_id}"}
+        if not future.done():
+            return {"status": "pending"}
+        del _TASKS[task_id]
+        _FINISHED.pop(task_id, None)
+    return {"status": "done", "result": future.result()}
+
+def wait_all(timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Block until every queued write has finished.
+    
+    Args:
+        timeout (Optional[float], optional): Maximum seconds to wait. Defaults to None.
+        
+    Returns:
+        Dict[str, Any]: {"results": {task_id: result}} for the finished tasks and
+        {"pending": [task_id, ...]} for any still running when the timeout hit
+    """
+    with _TASKS_LOCK:
+        tasks = dict(_TASKS)
+    done, not_done = wait(tasks.values(), timeout=timeout)
+    results = {}
+    with _TASKS_LOCK:
+        for task_id, future in tasks.items():
+            if future in done:
+                results[task_id] = future.result()
+                _TASKS.pop(task_id, None)
+                _FINISHED.pop(task_id, None)
+    return {"results": results, "pending": [t for t, f in tasks.items() if f in not_done]}
+
+if __name__ == "__main__":
+    print(list_repositories())
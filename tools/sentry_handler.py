@@ -1,15 +1,122 @@
 import requests
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import heapq
 import json
 import os
+import random
+import re
+import threading
+import time
 from dotenv import load_dotenv
 
+# orjson parses UTF-8 bytes directly and is several times faster than json on
+# the large issue/event payloads; fall back to json if absent
+try:
+    import orjson
+    _loads, _dumps = orjson.loads, orjson.dumps
+except ImportError:
+    orjson = None
+    _loads, _dumps = json.loads, json.dumps
+
 # Replace with your actual token securely
 TOKEN = os.getenv("SENTRY_AUTH_TOKEN")
 ORG_SLUG = "ibe08"
 BASE_URL = "https://sentry.io/api/0"
+# (connect, read) seconds; a stalled Sentry request fails fast instead of
+# blocking the tool call indefinitely
+HTTP_TIMEOUT = (5, 30)
+
+# Upper bound on a single response body for the large endpoints (issue lists,
+# events with stacktraces); guards against loading runaway payloads into memory.
+MAX_RESPONSE_BYTES = int(os.getenv("SENTRY_MAX_RESPONSE_BYTES", str(20 * 1024 * 1024)))
+
+# Default seconds between poll() calls; errors back off up to POLL_MAX_INTERVAL
+POLL_INTERVAL = float(os.getenv("SENTRY_POLL_INTERVAL", "30"))
+POLL_MAX_INTERVAL = 300
+
+# Issue listings are paginated with cursors; MAX_ISSUE_PAGES bounds how many
+# pages a single listing walks.
+ISSUES_PER_PAGE = 100
+MAX_ISSUE_PAGES = int(os.getenv("SENTRY_MAX_ISSUE_PAGES", "10"))
+# Matches the "next" entry of a Link header only when it has results
+_LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next";\s*results="true"')
+# Length of analyze_error_patterns' most_frequent_errors list
+MOST_FREQUENT_ERRORS = 10
+
+# Rate-limited (429) and transient 5xx responses are retried with exponential
+# backoff plus jitter, honoring Retry-After, so concurrent tool calls don't
+# retry in lockstep. The final response is handed back to the status checks.
+_RETRY_OPTIONS = dict(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "PUT"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+try:
+    _RETRY = Retry(backoff_jitter=0.3, **_RETRY_OPTIONS)
+except TypeError:  # urllib3 < 2 has no backoff_jitter
+    _RETRY = Retry(**_RETRY_OPTIONS)
 
+# Shared session so consecutive Sentry calls reuse pooled keep-alive
+# connections instead of paying a TCP+TLS handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRY))
+
+# Shared worker pool for fanning independent Sentry requests out concurrently,
+# kept within the session's connection pool. Only leaf requests are submitted to
+# it (never a task that itself waits on the pool), so it cannot deadlock.
+MAX_WORKERS = int(os.getenv("SENTRY_MAX_WORKERS", "16"))
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="sentry")
+
+# In-process TTL cache for the read-only endpoints, keyed on (function, args).
+# Sentry data moves on the order of minutes, so repeat tool calls within the
+# TTL are answered without a round trip. Error results are never cached.
+CACHE_MAX_ENTRIES = 256
+_CACHE: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+def _cached(ttl: int):
+    """
+    Caches a handler's successful result for `ttl` seconds.
+    
+    Args:
+        ttl (int): Seconds a cached result stays fresh
+        
+    Example:
+        >>> @_cached(ttl=60)
+        ... def list_projects() -> Dict[str, Any]:
+        ...     ...
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = _CACHE.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+            result = fn(*args, **kwargs)
+            if "error" not in result:
+                with _CACHE_LOCK:
+                    if key not in _CACHE and len(_CACHE) >= CACHE_MAX_ENTRIES:
+                        _CACHE.pop(next(iter(_CACHE)), None)
+                    _CACHE[key] = (now + ttl, result)
+            return result
+        return wrapper
+    return decorator
+
+# TOKEN and ORG_SLUG are fixed at import, so the config check and the
+# request headers are computed once and reused by every call.
+@lru_cache(maxsize=1)
 def _validate_config() -> Dict[str, Any]:
     """
     Validates the Sentry configuration by checking required environment variables.
@@ -34,9 +141,12 @@ def _validate_config() -> Dict[str, Any]:
         return {"error": "Configuration errors: " + "; ".join(errors)}
     return {"status": "ok"}
 
+@lru_cache(maxsize=1)
 def _get_headers() -> Dict[str, str]:
     """
-    Generates the headers required for Sentry API requests.
+    Generates the headers required for Sentry API requests and installs them
+    on the shared session, so individual requests don't pass headers at all.
+    Handlers call it first to validate the configuration.
     
     Returns:
         Dict[str, str]: Dictionary containing Authorization and Content-Type headers
@@ -45,17 +155,19 @@ def _get_headers() -> Dict[str, str]:
         ValueError: If configuration validation fails
         
     Example:
-        >>> headers = _get_headers()
-        >>> # Use headers in API request
-        >>> response = requests.get(url, headers=headers)
+        >>> _get_headers()
+        >>> # The session now carries the auth headers
+        >>> response = _SESSION.get(url)
     """
     config_status = _validate_config()
     if "error" in config_status:
         raise ValueError(config_status["error"])
-    return {
+    headers = {
         'Authorization': f'Bearer {TOKEN}',
         'Content-Type': 'application/json'
     }
+    _SESSION.headers.update(headers)
+    return headers
 
 def _handle_api_error(response: requests.Response) -> Dict[str, Any]:
     """
@@ -71,15 +183,15 @@ def _handle_api_error(response: requests.Response) -> Dict[str, Any]:
             - url: The URL that caused the error
             
     Example:
-        >>> response = requests.get(url)
+        >>> response = _SESSION.get(url)
         >>> if response.status_code != 200:
         ...     error = _handle_api_error(response)
         ...     print(f"API Error: {error['error']}")
     """
     try:
-        error_data = response.json()
+        error_data = _json(response)
         error_message = error_data.get('detail', str(error_data))
-    except:
+    except (ValueError, AttributeError):  # non-JSON body, or JSON without a detail mapping
         error_message = response.text or f"HTTP {response.status_code}"
     
     return {
@@ -88,6 +200,84 @@ def _handle_api_error(response: requests.Response) -> Dict[str, Any]:
         "url": response.url
     }
 
+def _json(response: requests.Response) -> Any:
+    """Decodes a response body from its raw bytes (orjson when available)."""
+    return _loads(response.content)
+
+def _read_json(response: requests.Response) -> Any:
+    """
+    Parses a streamed JSON response body, refusing bodies over MAX_RESPONSE_BYTES.
+    
+    Args:
+        response (requests.Response): A response requested with stream=True
+        
+    Returns:
+        Any: The decoded JSON payload
+        
+    Raises:
+        ValueError: If the body exceeds MAX_RESPONSE_BYTES or is not valid JSON
+        
+    Example:
+        >>> response = _SESSION.get(url, stream=True)
+        >>> issues = _read_json(response)
+    """
+    declared = response.headers.get("Content-Length")
+    if declared and int(declared) > MAX_RESPONSE_BYTES:
+        response.close()
+        raise ValueError(f"Response too large ({declared} bytes) from {response.url}")
+    
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) > MAX_RESPONSE_BYTES:
+            response.close()
+            raise ValueError(f"Response exceeded {MAX_RESPONSE_BYTES} bytes from {response.url}")
+    return _loads(body)
+
+def _iter_issues(project_slug: str, query: str = "", sort: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yields a project's issues, following Sentry's Link-header cursors.
+    
+    Pages are fetched one at a time (ISSUES_PER_PAGE each, at most
+    MAX_ISSUE_PAGES), so consumers aggregate with bounded memory.
+    
+    Args:
+        project_slug (str): The slug of the project
+        query (str, optional): Search query to filter issues. Defaults to "" (Sentry's default).
+        sort (Optional[str], optional): Server-side order (date, new, freq, user).
+                                        Defaults to None (Sentry's default).
+        
+    Yields:
+        Dict[str, Any]: Raw issue objects as returned by the API
+        
+    Raises:
+        requests.exceptions.HTTPError: If a page request fails
+        
+    Example:
+        >>> for issue in _iter_issues("my-project"):
+        ...     print(issue["title"])
+    """
+    url = f"{BASE_URL}/projects/{ORG_SLUG}/{project_slug}/issues/"
+    params = {"limit": ISSUES_PER_PAGE}
+    if query:
+        params["query"] = query
+    if sort:
+        params["sort"] = sort
+    _get_headers()
+    
+    for _ in range(MAX_ISSUE_PAGES):
+        response = _SESSION.get(url, params=params, stream=True, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        yield from _read_json(response)
+        
+        # The cursor for the next page is baked into its URL; Sentry always
+        # sends a "next" link and flags whether it has any results
+        match = _LINK_NEXT_RE.search(response.headers.get("Link", ""))
+        if not match:
+            return
+        url, params = match.group(1), None
+
+@_cached(ttl=60)
 def list_projects() -> Dict[str, Any]:
     """
     Retrieves a list of all available projects in the Sentry organization.
@@ -116,13 +306,13 @@ def list_projects() -> Dict[str, Any]:
             return config_status
         
         url = f"{BASE_URL}/organizations/{ORG_SLUG}/projects/"
-        headers = _get_headers()
-        response = requests.get(url, headers=headers)
+        _get_headers()
+        response = _SESSION.get(url, timeout=HTTP_TIMEOUT)
         
         if response.status_code != 200:
             return _handle_api_error(response)
         
-        projects = response.json()
+        projects = _json(response)
         return {
             "projects": [{
                 "id": project["id"],
@@ -134,11 +324,14 @@ def list_projects() -> Dict[str, Any]:
                 "isBookmarked": project.get("isBookmarked", False)
             } for project in projects]
         }
+    except requests.exceptions.Timeout:
+        return {"error": "Sentry API timed out"}
     except requests.exceptions.RequestException as e:
         return {"error": f"Network error: {str(e)}"}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}"}
 
+@_cached(ttl=300)  # project existence rarely changes
 def validate_project(project_slug: str) -> Dict[str, Any]:
     """
     Validates if a project exists and is accessible in the Sentry organization.
@@ -159,15 +352,15 @@ def validate_project(project_slug: str) -> Dict[str, Any]:
     """
     try:
         url = f"{BASE_URL}/projects/{ORG_SLUG}/{project_slug}/"
-        headers = _get_headers()
-        response = requests.get(url, headers=headers)
+        _get_headers()
+        response = _SESSION.get(url, timeout=HTTP_TIMEOUT)
         
         if response.status_code == 404:
             return {"error": f"Project '{project_slug}' not found in organization '{ORG_SLUG}'"}
         elif response.status_code != 200:
             return _handle_api_error(response)
         
-        project_data = response.json()
+        project_data = _json(response)
         return {
             "status": "valid",
             "project": {
@@ -181,6 +374,7 @@ def validate_project(project_slug: str) -> Dict[str, Any]:
     except Exception as e:
         return {"error": f"Project validation failed: {str(e)}"}
 
+@_cached(ttl=60)
 def get_sentry_issues(project_slug: str, query: str = "", stats_period: str = "24h") -> Dict[str, Any]:
     """
     Retrieves issues for a specific project with optional filtering.
@@ -216,27 +410,36 @@ def get_sentry_issues(project_slug: str, query: str = "", stats_period: str = "2
         if "error" in config_status:
             return config_status
             
-        # Validate project exists
-        project_status = validate_project(project_slug)
-        if "error" in project_status:
-            return project_status
-        
-        url = f"{BASE_URL}/projects/{ORG_SLUG}/{project_slug}/issues/"
-        
-        headers = _get_headers()
-        response = requests.get(url, headers=headers)
-        
-        if response.status_code == 404:
-            return {"error": f"Project '{project_slug}' not found in organization '{ORG_SLUG}'"}
-        elif response.status_code == 403:
-            return {"error": "Authentication failed. Please check your SENTRY_AUTH_TOKEN"}
-        elif response.status_code != 200:
+        # The issues request answers 404 for an unknown project by itself, so
+        # there is no separate validation round trip
+        try:
+            raw_issues = list(_iter_issues(project_slug, query))
+        except requests.exceptions.HTTPError as e:
+            response = e.response
+            if response.status_code == 404:
+                return {"error": f"Project '{project_slug}' not found in organization '{ORG_SLUG}'"}
+            elif response.status_code == 403:
+                return {"error": "Authentication failed. Please check your SENTRY_AUTH_TOKEN"}
             return _handle_api_error(response)
         
-        issues = response.json()
+        # Every issue embeds its project; only an empty listing needs a lookup
+        if raw_issues:
+            project_data = raw_issues[0]["project"]
+            project = {
+                "id": project_data["id"],
+                "slug": project_data["slug"],
+                "name": project_data["name"],
+                "platform": project_data.get("platform"),
+                "status": project_data.get("status")
+            }
+        else:
+            project_status = validate_project(project_slug)
+            if "error" in project_status:
+                return project_status
+            project = project_status["project"]
         
         return {
-            "project": project_status["project"],
+            "project": project,
             "issues": [{
                 "id": issue["id"],
                 "title": issue["title"],
@@ -250,8 +453,10 @@ def get_sentry_issues(project_slug: str, query: str = "", stats_period: str = "2
                 "culprit": issue.get("culprit", ""),
                 "type": issue["type"],
                 "metadata": issue.get("metadata", {})
-            } for issue in issues]
+            } for issue in raw_issues]
         }
+    except requests.exceptions.Timeout:
+        return {"error": "Sentry API timed out"}
     except requests.exceptions.RequestException as e:
         return {"error": f"Network error: {str(e)}"}
     except Exception as e:
@@ -268,11 +473,11 @@ def test_connection() -> Dict[str, Any]:
         
         # Try to get organization info
         url = f"{BASE_URL}/organizations/{ORG_SLUG}/"
-        headers = _get_headers()
-        response = requests.get(url, headers=headers)
+        _get_headers()
+        response = _SESSION.get(url, timeout=HTTP_TIMEOUT)
         
         if response.status_code == 200:
-            org_data = response.json()
+            org_data = _json(response)
             return {
                 "status": "success",
                 "organization": {
@@ -315,18 +520,21 @@ def get_issue_details(project_slug: str, issue_id: str) -> Dict[str, Any]:
         return {"error": "SENTRY_ORG_SLUG not set."}
     
     url = f"{BASE_URL}/projects/{ORG_SLUG}/{project_slug}/issues/{issue_id}/"
+    # The latest event carries the stacktrace
+    events_url = f"{url}events/latest/"
     
     try:
-        headers = _get_headers()
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        issue = response.json()
+        _get_headers()
+        # The issue and its latest event are independent requests
+        issue_future = _EXECUTOR.submit(_SESSION.get, url, stream=True, timeout=HTTP_TIMEOUT)
+        events_future = _EXECUTOR.submit(_SESSION.get, events_url, stream=True, timeout=HTTP_TIMEOUT)
+        response = issue_future.result()
+        events_response = events_future.result()
         
-        # Get the latest event for stacktrace
-        events_url = f"{BASE_URL}/projects/{ORG_SLUG}/{project_slug}/issues/{issue_id}/events/latest/"
-        events_response = requests.get(events_url, headers=headers)
+        response.raise_for_status()
+        issue = _read_json(response)
         events_response.raise_for_status()
-        event = events_response.json()
+        event = _read_json(events_response)
         
         return {
             "issue": {
@@ -351,6 +559,7 @@ def get_issue_details(project_slug: str, issue_id: str) -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
 
+@_cached(ttl=300)
 def get_error_frequency(project_slug: str, days: int = 7) -> Dict[str, Any]:
     """
     Analyzes error frequency statistics over a specified time period.
@@ -377,7 +586,9 @@ def get_error_frequency(project_slug: str, days: int = 7) -> Dict[str, Any]:
         return {"error": "SENTRY_ORG_SLUG not set."}
     
     url = f"{BASE_URL}/projects/{ORG_SLUG}/{project_slug}/stats/"
-    end = datetime.now()
+    # Explicit UTC so Sentry doesn't have to guess the zone; rounding to the
+    # minute keeps the window identical for calls within the same minute
+    end = datetime.now(timezone.utc).replace(second=0, microsecond=0)
     start = end - timedelta(days=days)
     
     params = {
@@ -388,10 +599,10 @@ def get_error_frequency(project_slug: str, days: int = 7) -> Dict[str, Any]:
     }
     
     try:
-        headers = _get_headers()
-        response = requests.get(url, headers=headers, params=params)
+        _get_headers()
+        response = _SESSION.get(url, params=params, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
-        stats = response.json()
+        stats = _json(response)
         
         return {
             "statistics": {
@@ -404,6 +615,7 @@ def get_error_frequency(project_slug: str, days: int = 7) -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
 
+@_cached(ttl=300)
 def get_error_patterns(project_slug: str, days: int = 7) -> Dict[str, Any]:
     """
     Analyzes and groups similar errors to identify patterns.
@@ -436,48 +648,67 @@ def get_error_patterns(project_slug: str, days: int = 7) -> Dict[str, Any]:
     if "error" in issues:
         return issues
     
-    # Group issues by type and level
-    patterns = {
-        "by_type": {},
-        "by_level": {},
-        "by_culprit": {}
-    }
-    
+    # Count issues by type, level and culprit (function/method)
+    by_type, by_level, by_culprit = Counter(), Counter(), Counter()
     for issue in issues["issues"]:
-        # Group by type
-        issue_type = issue["type"]
-        if issue_type not in patterns["by_type"]:
-            patterns["by_type"][issue_type] = []
-        patterns["by_type"][issue_type].append(issue)
-        
-        # Group by level
-        level = issue["level"]
-        if level not in patterns["by_level"]:
-            patterns["by_level"][level] = []
-        patterns["by_level"][level].append(issue)
-        
-        # Group by culprit (function/method)
+        by_type[issue["type"]] += 1
+        by_level[issue["level"]] += 1
         if "culprit" in issue:
-            culprit = issue["culprit"]
-            if culprit not in patterns["by_culprit"]:
-                patterns["by_culprit"][culprit] = []
-            patterns["by_culprit"][culprit].append(issue)
+            by_culprit[issue["culprit"]] += 1
     
     return {
         "patterns": {
             "timeframe": f"Last {days} days",
             "total_issues": len(issues["issues"]),
-            "by_type": {k: len(v) for k, v in patterns["by_type"].items()},
-            "by_level": {k: len(v) for k, v in patterns["by_level"].items()},
-            "by_culprit": {k: len(v) for k, v in patterns["by_culprit"].items()},
-            "most_frequent_culprits": sorted(
-                [(k, len(v)) for k, v in patterns["by_culprit"].items()],
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]
+            "by_type": dict(by_type),
+            "by_level": dict(by_level),
+            "by_culprit": dict(by_culprit),
+            "most_frequent_culprits": by_culprit.most_common(5)
         }
     }
 
+@_cached(ttl=300)
+def get_top_errors(project_slug: str, limit: int = MOST_FREQUENT_ERRORS) -> Dict[str, Any]:
+    """
+    Retrieves a project's most frequent issues without walking every page.
+    
+    Issues are requested sorted by frequency (sort=freq), so the first `limit`
+    of them are the answer and pagination stops there; usually one request.
+    
+    Args:
+        project_slug (str): The slug of the project
+        limit (int, optional): Number of issues to return. Defaults to 10.
+        
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - most_frequent_errors: Issues in descending frequency, shaped like
+              analyze_error_patterns' frequency_analysis.most_frequent_errors
+            - error: Error message if the request fails
+            
+    Example:
+        >>> top = get_top_errors("my-project", limit=5)
+        >>> for issue in top.get("most_frequent_errors", []):
+        ...     print(f"{issue['title']}: {issue['count']}")
+    """
+    if not ORG_SLUG:
+        return {"error": "SENTRY_ORG_SLUG not set."}
+    
+    try:
+        return {
+            "most_frequent_errors": [{
+                "id": issue.get("id"),
+                "title": issue.get("title"),
+                "count": int(issue.get("count", 0)),
+                "userCount": int(issue.get("userCount", 0)),
+                "priority": issue.get("priority"),
+                "platform": issue.get("platform"),
+                "firstSeen": issue.get("firstSeen"),
+                "lastSeen": issue.get("lastSeen")
+            } for issue in islice(_iter_issues(project_slug, sort="freq"), limit)]
+        }
+    except Exception as e:
+        return {"error": f"Failed to get top errors: {str(e)}"}
+
 def update_issue_status(project_slug: str, issue_id: str, status: str) -> Dict[str, Any]:
     """
     Updates the status of a specific issue.
@@ -504,19 +735,23 @@ def update_issue_status(project_slug: str, issue_id: str, status: str) -> Dict[s
     url = f"{BASE_URL}/projects/{ORG_SLUG}/{project_slug}/issues/{issue_id}/"
     
     try:
-        headers = _get_headers()
-        data = {"status": status}
-        response = requests.put(url, headers=headers, json=data)
+        _get_headers()
+        data = _dumps({"status": status})
+        response = _SESSION.put(url, data=data, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
+        # Issue listings and the stats derived from them are now stale
+        with _CACHE_LOCK:
+            _CACHE.clear()
         
         return {
             "status": "success",
             "message": f"Issue {issue_id} status updated to {status}",
-            "issue": response.json()
+            "issue": _json(response)
         }
     except Exception as e:
         return {"error": str(e)}
 
+@_cached(ttl=300)
 def get_project_stats(project_slug: str) -> Dict[str, Any]:
     """
     Retrieves overall project statistics and health metrics.
@@ -545,17 +780,29 @@ def get_project_stats(project_slug: str) -> Dict[str, Any]:
     url = f"{BASE_URL}/projects/{ORG_SLUG}/{project_slug}/stats/"
     
     try:
-        headers = _get_headers()
-        # Get various stats periods
-        stats = {}
-        for period in ["1h", "24h", "7d", "30d"]:
-            params = {"stat": "received", "resolution": "1h" if period == "1h" else "1d"}
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            stats[period] = response.json()
+        _get_headers()
+        periods = ["1h", "24h", "7d", "30d"]
         
-        # Get current issues
+        # The period requests are independent, so fetch them concurrently
+        # while the current issues are fetched on this thread
+        futures = {
+            period: _EXECUTOR.submit(
+                _SESSION.get, url, timeout=HTTP_TIMEOUT,
+                params={"stat": "received", "resolution": "1h" if period == "1h" else "1d"}
+            )
+            for period in periods
+        }
         issues = get_sentry_issues(project_slug, stats_period="24h")
+        responses = {period: future.result() for period, future in futures.items()}
+        # A failed issue lookup is not "0 current issues"; surface it rather
+        # than let _cached keep a wrong health snapshot.
+        if "error" in issues:
+            return issues
+        
+        stats = {}
+        for period, response in responses.items():
+            response.raise_for_status()
+            stats[period] = _json(response)
         
         return {
             "project_health": {
@@ -572,13 +819,47 @@ def get_project_stats(project_slug: str) -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
 
-def get_detailed_stacktrace(project_slug: str, issue_id: str) -> Dict[str, Any]:
+def get_stats_for_all_projects(max_workers: int = 8) -> Dict[str, Any]:
+    """
+    Retrieves get_project_stats for every project in the organization concurrently.
+    
+    Args:
+        max_workers (int, optional): Maximum number of projects fetched at once.
+                                     Defaults to 8.
+        
+    Returns:
+        Dict[str, Any]: A dictionary containing either:
+            - projects: {project_slug: result} where each result has the same
+              shape as get_project_stats' return value
+            - error: Error message if the projects cannot be listed
+            
+    Example:
+        >>> all_stats = get_stats_for_all_projects()
+        >>> for slug, stats in all_stats.get("projects", {}).items():
+        ...     print(slug, stats.get("project_health", {}).get("current_issues"))
+    """
+    projects = list_projects()
+    if "error" in projects:
+        return projects
+    
+    slugs = [project["slug"] for project in projects["projects"]]
+    if not slugs:
+        return {"projects": {}}
+    # get_project_stats waits on the shared _EXECUTOR itself, so the per-project
+    # calls run on their own pool rather than nesting inside that one
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(slugs))) as executor:
+        return {"projects": dict(zip(slugs, executor.map(get_project_stats, slugs)))}
+
+def get_detailed_stacktrace(project_slug: str, issue_id: str, verbose: bool = False) -> Dict[str, Any]:
     """
     Retrieves and analyzes detailed stacktrace information for a specific issue.
     
     Args:
         project_slug (str): The slug of the project
         issue_id (str): The ID of the issue
+        verbose (bool, optional): Include each frame's source context and local
+            variables (context, pre_context, post_context, variables). These
+            dominate the payload size, so they are left out by default. Defaults to False.
         
     Returns:
         Dict[str, Any]: A dictionary containing:
@@ -599,45 +880,47 @@ def get_detailed_stacktrace(project_slug: str, issue_id: str) -> Dict[str, Any]:
         return {"error": "SENTRY_ORG_SLUG not set."}
     
     try:
-        headers = _get_headers()
+        _get_headers()
         
-        # Get issue details
+        # Get issue details and the latest event (for the stacktrace) concurrently
         issue_url = f"{BASE_URL}/issues/{issue_id}/"
-        response = requests.get(issue_url, headers=headers)
-        response.raise_for_status()
-        issue_data = response.json()
-        
-        # Get the latest event for stacktrace
         events_url = f"{BASE_URL}/issues/{issue_id}/events/latest/"
-        events_response = requests.get(events_url, headers=headers)
+        issue_future = _EXECUTOR.submit(_SESSION.get, issue_url, stream=True, timeout=HTTP_TIMEOUT)
+        events_future = _EXECUTOR.submit(_SESSION.get, events_url, stream=True, timeout=HTTP_TIMEOUT)
+        response = issue_future.result()
+        events_response = events_future.result()
+        
+        response.raise_for_status()
+        issue_data = _read_json(response)
         events_response.raise_for_status()
-        event = events_response.json()
+        event = _read_json(events_response)
         
         # Extract stacktrace information
         stacktrace_data = []
         for entry in event.get("entries", []):
-            if entry.get("type") == "exception":
-                for exc in entry.get("data", {}).get("values", []):
-                    stacktrace = exc.get("stacktrace", {})
-                    frames = stacktrace.get("frames", [])
-                    
-                    # Analyze each frame in detail
-                    for frame in frames:
-                        frame_data = {
-                            "filename": frame.get("filename"),
-                            "function": frame.get("function"),
-                            "line_number": frame.get("lineno"),
-                            "column_number": frame.get("colno"),
-                            "context": frame.get("context", []),
-                            "variables": frame.get("vars", {}),
-                            "is_in_app": frame.get("in_app", False),
-                            "module": frame.get("module"),
-                            "package": frame.get("package"),
-                            "abs_path": frame.get("abs_path"),
-                            "pre_context": frame.get("pre_context", []),
-                            "post_context": frame.get("post_context", [])
-                        }
-                        stacktrace_data.append(frame_data)
+            if entry.get("type") != "exception":
+                continue
+            for exc in entry.get("data", {}).get("values", []):
+                stacktrace = exc.get("stacktrace") or {}
+                
+                # Analyze each frame in detail
+                for frame in stacktrace.get("frames", []):
+                    frame_data = {
+                        "filename": frame.get("filename"),
+                        "function": frame.get("function"),
+                        "line_number": frame.get("lineno"),
+                        "column_number": frame.get("colno"),
+                        "is_in_app": frame.get("in_app", False),
+                        "module": frame.get("module"),
+                        "package": frame.get("package"),
+                        "abs_path": frame.get("abs_path")
+                    }
+                    if verbose:
+                        frame_data["context"] = frame.get("context", [])
+                        frame_data["variables"] = frame.get("vars", {})
+                        frame_data["pre_context"] = frame.get("pre_context", [])
+                        frame_data["post_context"] = frame.get("post_context", [])
+                    stacktrace_data.append(frame_data)
         
         return {
             "issue": {
@@ -696,103 +979,121 @@ def analyze_error_patterns(project_slug: str, days: int = 7) -> Dict[str, Any]:
         return {"error": "SENTRY_ORG_SLUG not set."}
     
     try:
-        headers = _get_headers()
-        
-        # Get all issues for the period
-        issues_url = f"{BASE_URL}/projects/{ORG_SLUG}/{project_slug}/issues/"
-        response = requests.get(issues_url, headers=headers)
-        response.raise_for_status()
-        issues = response.json()
-        
-        # Analyze patterns
-        patterns = {
-            "timeframe": f"Last {days} days",
-            "total_issues": len(issues),
-            "error_distribution": {
-                "by_type": {},
-                "by_level": {},
-                "by_platform": {},
-                "by_priority": {}
-            },
-            "frequency_analysis": {
-                "total_errors": 0,
-                "total_users_affected": 0,
-                "most_frequent_errors": []
-            },
-            "platform_analysis": {},
-            "priority_analysis": {
-                "high": 0,
-                "medium": 0,
-                "low": 0
-            }
-        }
+        # Counters for each distribution; per-platform totals start zeroed
+        by_type, by_level, by_platform, by_priority = Counter(), Counter(), Counter(), Counter()
+        priority_analysis = Counter({"high": 0, "medium": 0, "low": 0})
+        platform_analysis = defaultdict(lambda: {"total_errors": 0, "total_users": 0, "issues": []})
+        total_issues = total_errors = total_users_affected = 0
         
-        # Process each issue
-        for issue in issues:
-            # Error type distribution
-            error_type = issue.get("type", "unknown")
-            patterns["error_distribution"]["by_type"][error_type] = patterns["error_distribution"]["by_type"].get(error_type, 0) + 1
+        # Process each issue in a single pass over the pages as they stream
+        # in, keeping a running top-N heap of (count, -position, issue) so ties
+        # keep their listing order
+        top_errors = []
+        heappush, heapreplace = heapq.heappush, heapq.heapreplace
+        for position, issue in enumerate(_iter_issues(project_slug)):
+            total_issues += 1
             
-            # Error level distribution
-            level = issue.get("level", "unknown")
-            patterns["error_distribution"]["by_level"][level] = patterns["error_distribution"]["by_level"].get(level, 0) + 1
-            
-            # Platform distribution
+            # Type, level, platform and priority distributions
+            by_type[issue.get("type", "unknown")] += 1
+            by_level[issue.get("level", "unknown")] += 1
             platform = issue.get("platform", "unknown")
-            patterns["error_distribution"]["by_platform"][platform] = patterns["error_distribution"]["by_platform"].get(platform, 0) + 1
-            
-            # Priority distribution
+            by_platform[platform] += 1
             priority = issue.get("priority", "medium")
-            patterns["error_distribution"]["by_priority"][priority] = patterns["error_distribution"]["by_priority"].get(priority, 0) + 1
-            patterns["priority_analysis"][priority] = patterns["priority_analysis"].get(priority, 0) + 1
+            by_priority[priority] += 1
+            priority_analysis[priority] += 1
             
-            # User impact
+            # User impact and error count
             user_count = int(issue.get("userCount", 0))
-            patterns["frequency_analysis"]["total_users_affected"] += user_count
-            
-            # Error count
+            total_users_affected += user_count
             error_count = int(issue.get("count", 0))
-            patterns["frequency_analysis"]["total_errors"] += error_count
+            total_errors += error_count
             
             # Platform analysis
-            if platform not in patterns["platform_analysis"]:
-                patterns["platform_analysis"][platform] = {
-                    "total_errors": 0,
-                    "total_users": 0,
-                    "issues": []
-                }
-            patterns["platform_analysis"][platform]["total_errors"] += error_count
-            patterns["platform_analysis"][platform]["total_users"] += user_count
-            patterns["platform_analysis"][platform]["issues"].append({
+            platform_stats = platform_analysis[platform]
+            platform_stats["total_errors"] += error_count
+            platform_stats["total_users"] += user_count
+            platform_stats["issues"].append({
                 "id": issue.get("id"),
                 "title": issue.get("title"),
                 "count": error_count,
                 "userCount": user_count,
                 "priority": priority
             })
+            
+            # Most frequent errors
+            entry = (error_count, -position, issue)
+            if len(top_errors) < MOST_FREQUENT_ERRORS:
+                heappush(top_errors, entry)
+            elif entry > top_errors[0]:
+                heapreplace(top_errors, entry)
         
-        # Sort and get most frequent errors
-        patterns["frequency_analysis"]["most_frequent_errors"] = sorted(
-            [{
-                "id": issue.get("id"),
-                "title": issue.get("title"),
-                "count": int(issue.get("count", 0)),
-                "userCount": int(issue.get("userCount", 0)),
-                "priority": issue.get("priority"),
-                "platform": issue.get("platform"),
-                "firstSeen": issue.get("firstSeen"),
-                "lastSeen": issue.get("lastSeen")
-            } for issue in issues],
-            key=lambda x: x["count"],
-            reverse=True
-        )[:10]
+        patterns = {
+            "timeframe": f"Last {days} days",
+            "total_issues": total_issues,
+            "error_distribution": {
+                "by_type": dict(by_type),
+                "by_level": dict(by_level),
+                "by_platform": dict(by_platform),
+                "by_priority": dict(by_priority)
+            },
+            "frequency_analysis": {
+                "total_errors": total_errors,
+                "total_users_affected": total_users_affected,
+                "most_frequent_errors": [{
+                    "id": issue.get("id"),
+                    "title": issue.get("title"),
+                    "count": error_count,
+                    "userCount": int(issue.get("userCount", 0)),
+                    "priority": issue.get("priority"),
+                    "platform": issue.get("platform"),
+                    "firstSeen": issue.get("firstSeen"),
+                    "lastSeen": issue.get("lastSeen")
+                } for error_count, _, issue in sorted(top_errors, reverse=True)]
+            },
+            "platform_analysis": dict(platform_analysis),
+            "priority_analysis": dict(priority_analysis)
+        }
         
         return patterns
         
     except Exception as e:
         return {"error": f"Failed to analyze error patterns: {str(e)}"}
 
-if __name__ == "__main__":
+def poll(fn, *args, interval: float = POLL_INTERVAL, max_interval: float = POLL_MAX_INTERVAL,
+         jitter: float = 0.2, **kwargs) -> Iterator[Dict[str, Any]]:
+    """
+    Repeatedly calls a handler, yielding each result; the canonical way to
+    watch get_sentry_issues or get_error_frequency.
+    
+    The wait doubles after every error result (up to max_interval) and resets
+    on success, and each wait is randomized by +/- jitter so many pollers
+    don't hit Sentry in lockstep during an incident.
+    
+    Args:
+        fn: Handler to call, e.g. get_sentry_issues
+        *args: Positional arguments for fn
+        interval (float, optional): Seconds between successful calls. Defaults to SENTRY_POLL_INTERVAL (30).
+        max_interval (float, optional): Upper bound on the backed-off wait. Defaults to 300.
+        jitter (float, optional): Fractional randomization of each wait. Defaults to 0.2.
+        **kwargs: Keyword arguments for fn
+        
+    Yields:
+        Dict[str, Any]: Each result of fn, including error results
+        
+    Example:
+        >>> for result in poll(get_sentry_issues, "my-project", query="is:unresolved"):
+        ...     print(f"{len(result.get('issues', []))} unresolved issues")
+    """
+    wait = interval
+    while True:
+        result = fn(*args, **kwargs)
+        yield result
+        wait = min(wait * 2, max_interval) if "error" in result else interval
+        time.sleep(wait * random.uniform(1 - jitter, 1 + jitter))
+
+# Live smoke test against the configured organization. It makes real API
+# calls, so it only runs when SENTRY_HANDLER_SMOKE_TEST=1 is set.
+if __name__ == "__main__" and os.environ.get("SENTRY_HANDLER_SMOKE_TEST") == "1":
     # Test connection first
     print("Testing Sentry connection...")
     connection_test = test_connection()
@@ -808,14 +1109,15 @@ if __name__ == "__main__":
         print("Project validation result:", json.dumps(project_status, indent=2))
         
         if "status" in project_status and project_status["status"] == "valid":
-            # Test detailed stacktrace
-            print(f"\nFetching detailed stacktrace for issue {issue_id}...")
-            stacktrace = get_detailed_stacktrace(project_slug, issue_id)
+            # The stacktrace and pattern checks are independent, so run them
+            # side by side (on their own pool: both wait on _EXECUTOR)
+            print(f"\nFetching detailed stacktrace for issue {issue_id} and analyzing error patterns...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                stacktrace_future = executor.submit(get_detailed_stacktrace, project_slug, issue_id)
+                patterns_future = executor.submit(analyze_error_patterns, project_slug, days=7)
+                stacktrace = stacktrace_future.result()
+                patterns = patterns_future.result()
             print("Detailed stacktrace result:", json.dumps(stacktrace, indent=2))
-            
-            # Test error pattern analysis
-            print(f"\nAnalyzing error patterns for project '{project_slug}'...")
-            patterns = analyze_error_patterns(project_slug, days=7)
             print("Error patterns analysis:", json.dumps(patterns, indent=2))
         else:
             print("\nSkipping issue analysis due to invalid project")
@@ -1,29 +1,91 @@
 import os
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_PORT = int(os.environ.get("CUSTOM_WEATHER_API_PORT", 5000))
 API_URL = f"http://localhost:{API_PORT}/weather"
+# (connect, read) seconds. Connecting to localhost should be instant; the read
+# allows for the API's own upstream OpenWeatherMap call and its retries.
+TIMEOUT = (0.5, 10.0)
+# Failures carry a stable "code" tag next to the human-readable "error", so
+# callers can branch on the kind of failure without parsing the message.
+# The fixed ones are built once; callers get a copy.
+_CONN_ERR = {
+    "error": f"Could not connect to custom weather API at {API_URL}. Is it running?",
+    "code": "weather_api_unreachable",
+    "url": API_URL,
+}
+_TIMEOUT_ERR = {
+    "error": f"Weather API at {API_URL} timed out",
+    "code": "weather_api_timeout",
+    "url": API_URL,
+}
+
+# Shared session so repeat lookups reuse a keep-alive connection to the
+# weather API instead of opening a new socket per call. A gateway hiccup in
+# front of the API (502/503/504) gets one quick retry before surfacing.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=1,
+        backoff_factor=0.05,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,  # hand the final response to raise_for_status below
+    ),
+))
+
+# Agent loops tend to ask for the same location several times in a row, and
+# weather moves slowly, so successful lookups are reused for CACHE_TTL seconds.
+CACHE_TTL = 60
+CACHE_MAX_ENTRIES = 256
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
 
 def get_current_weather(location):
-    """Calls our *custom* weather API."""
+    """Calls our *custom* weather API, serving repeat lookups from a short-lived cache."""
+    key = location.strip().lower()
+    now = time.monotonic()
+    entry = _CACHE.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+
+    result = _fetch_current_weather(location)
+    if "error" not in result:
+        with _CACHE_LOCK:
+            if key not in _CACHE and len(_CACHE) >= CACHE_MAX_ENTRIES:
+                _CACHE.pop(next(iter(_CACHE)), None)
+            _CACHE[key] = (now + CACHE_TTL, result)
+    return result
+
+def _fetch_current_weather(location):
     try:
-        response = requests.get(API_URL, params={'location': location})
+        response = _SESSION.get(API_URL, params={'location': location}, timeout=TIMEOUT)
         response.raise_for_status()
         data = response.json()
 
         if "error" in data: return data
 
         main = data.get('main', {})
-        weather_desc = data.get('weather', [{}])[0].get('description', 'N/A')
+        weather_list = data.get('weather') or ()
+        weather_desc = weather_list[0].get('description', 'N/A') if weather_list else 'N/A'
         return {
             "location": data.get('name', location),
             "conditions": weather_desc.capitalize(),
             "temperature_c": main.get('temp', 'N/A'),
             "humidity_percent": main.get('humidity', 'N/A')
         }
+    except requests.exceptions.Timeout:
+        return dict(_TIMEOUT_ERR)
     except requests.exceptions.ConnectionError:
-        return {"error": f"Could not connect to custom weather API at {API_URL}. Is it running?"}
+        return dict(_CONN_ERR)
     except Exception as e:
-        return {"error": f"Error calling custom weather API: {e}"}
-    
-print(get_current_weather("New York"))
\ No newline at end of file
+        return {"error": f"Error calling custom weather API: {e}", "code": "weather_api_failed", "detail": repr(e)}
+
+if __name__ == "__main__":
+    print(get_current_weather("New York"))